@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Tuple
+
+DISPLAY_ASSETS = ("USDT", "BTC")
+
+
+def asset_balances(
+    account: Dict[str, Any], assets: Iterable[str] = DISPLAY_ASSETS
+) -> Dict[str, Tuple[str, str]]:
+    # Only the displayed assets; testnet accounts list hundreds of balances.
+    wanted = frozenset(assets)
+    return {
+        b["asset"]: (b["free"], b["locked"])
+        for b in account["balances"]
+        if b["asset"] in wanted
+    }
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Iterable, Mapping, Optional
+
+import pandas as pd
+
+try:
+    import pyarrow  # noqa: F401
+
+    CSV_ENGINE = "pyarrow"
+except ImportError:
+    CSV_ENGINE = "c"
+
+
+def read_trades(
+    path: Path,
+    columns: Optional[Iterable[str]] = None,
+    dtype: Any = None,
+) -> pd.DataFrame:
+    # The pyarrow engine rejects usecols missing from the file, so select from the
+    # header first; columns keep file order either way.
+    header = pd.read_csv(path, nrows=0).columns.tolist()
+    if columns is None:
+        usecols = header
+    else:
+        wanted = frozenset(columns)
+        usecols = [c for c in header if c in wanted]
+    if isinstance(dtype, Mapping):
+        dtype = {c: t for c, t in dtype.items() if c in usecols}
+    return pd.read_csv(path, usecols=usecols, dtype=dtype, engine=CSV_ENGINE)
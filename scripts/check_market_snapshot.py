@@ -1,31 +1,52 @@
 from __future__ import annotations
 
 import argparse
-import csv
-import math
 from pathlib import Path
-from statistics import mean, pstdev
-from typing import Optional
 
+import numpy as np
+import pandas as pd
 
-def _to_float(value: str) -> Optional[float]:
-    try:
-        return float(value)
-    except (TypeError, ValueError):
-        return None
+from scripts._io import read_trades
 
 
-def _to_int(value: str) -> Optional[int]:
-    try:
-        return int(value)
-    except (TypeError, ValueError):
-        return None
+SNAPSHOT_COLUMNS = [
+    "depth_update_id",
+    "imbalance",
+    "bid_qty",
+    "ask_qty",
+    "best_bid",
+    "best_ask",
+]
 
 
-def _summary(values: list[float]) -> tuple[float, float, float, float]:
-    if not values:
+def _to_numeric(series: pd.Series) -> pd.Series:
+    return pd.to_numeric(series, errors="coerce")
+
+
+def _finite(series: pd.Series) -> pd.Series:
+    return series[np.isfinite(series)]
+
+
+def _count_unique_pairs(left: np.ndarray, right: np.ndarray) -> int:
+    # View each (left, right) float64 row as one 16-byte record so uniqueness is
+    # a single sort over packed values instead of hashing per-row tuples.
+    pairs = np.ascontiguousarray(np.stack([left, right], axis=1))
+    pairs = pairs[~np.isnan(pairs).any(axis=1)]
+    if pairs.shape[0] == 0:
+        return 0
+    records = pairs.view([("left", "f8"), ("right", "f8")]).ravel()
+    return int(np.unique(records).size)
+
+
+def _summary(values: pd.Series) -> tuple[float, float, float, float]:
+    if values.empty:
         return 0.0, 0.0, 0.0, 0.0
-    return mean(values), pstdev(values), min(values), max(values)
+    return (
+        float(values.mean()),
+        float(values.std(ddof=0)),
+        float(values.min()),
+        float(values.max()),
+    )
 
 
 def main() -> None:
@@ -37,53 +58,38 @@ def main() -> None:
     if not csv_path.exists():
         raise FileNotFoundError(f"CSV not found: {csv_path}")
 
-    with csv_path.open("r", newline="", encoding="utf-8") as f:
-        rows = list(csv.DictReader(f))
+    df = read_trades(csv_path, columns=SNAPSHOT_COLUMNS, dtype=str)
+    df = df.reindex(columns=SNAPSHOT_COLUMNS)
 
-    n_rows = len(rows)
+    n_rows = len(df)
     if n_rows == 0:
         print("rows=0")
         return
 
-    depth_ids = [_to_int((row.get("depth_update_id") or "").strip()) for row in rows]
-    depth_valid = [d for d in depth_ids if d is not None]
-    missing_depth = sum(1 for d in depth_ids if d is None)
-    pct_missing_depth = (missing_depth / n_rows) * 100.0
-
-    imbalances = []
-    bid_qty = []
-    ask_qty = []
-    best_quotes = set()
-
-    for row in rows:
-        imb = _to_float(row.get("imbalance", ""))
-        if (imb is not None) and math.isfinite(imb):
-            imbalances.append(imb)
+    depth_ids = _to_numeric(df["depth_update_id"])
+    depth_valid = int(depth_ids.notna().sum())
+    pct_missing_depth = ((n_rows - depth_valid) / n_rows) * 100.0
 
-        bq = _to_float(row.get("bid_qty", ""))
-        if (bq is not None) and math.isfinite(bq):
-            bid_qty.append(bq)
-
-        aq = _to_float(row.get("ask_qty", ""))
-        if (aq is not None) and math.isfinite(aq):
-            ask_qty.append(aq)
-
-        best_bid = _to_float(row.get("best_bid", ""))
-        best_ask = _to_float(row.get("best_ask", ""))
-        if (best_bid is not None) and (best_ask is not None):
-            best_quotes.add((best_bid, best_ask))
+    imbalances = _finite(_to_numeric(df["imbalance"]))
+    bid_qty = _finite(_to_numeric(df["bid_qty"]))
+    ask_qty = _finite(_to_numeric(df["ask_qty"]))
+    unique_best_quotes = _count_unique_pairs(
+        _to_numeric(df["best_bid"]).to_numpy(dtype=np.float64),
+        _to_numeric(df["best_ask"]).to_numpy(dtype=np.float64),
+    )
 
     imb_mean, imb_std, imb_min, imb_max = _summary(imbalances)
     bq_mean, bq_std, bq_min, bq_max = _summary(bid_qty)
     aq_mean, aq_std, aq_min, aq_max = _summary(ask_qty)
+    imb_arr = imbalances.to_numpy(dtype=np.float64)
     pct_abs_imb_gt_09 = (
-        (sum(1 for x in imbalances if abs(x) > 0.9) / len(imbalances)) * 100.0
-        if imbalances
+        np.count_nonzero(np.abs(imb_arr) > 0.9) / imb_arr.size * 100.0
+        if imb_arr.size
         else 0.0
     )
 
     print(f"rows={n_rows}")
-    print(f"depth_update_id_valid_rows={len(depth_valid)}")
+    print(f"depth_update_id_valid_rows={depth_valid}")
     print(f"depth_update_id_missing_pct={pct_missing_depth:.2f}")
     print(
         "imbalance_summary:"
@@ -110,7 +116,7 @@ def main() -> None:
         f" min={aq_min:.8f}"
         f" max={aq_max:.8f}"
     )
-    print(f"unique_best_bid_ask={len(best_quotes)}")
+    print(f"unique_best_bid_ask={unique_best_quotes}")
 
 
 if __name__ == "__main__":
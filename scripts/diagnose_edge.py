@@ -3,14 +3,17 @@ from __future__ import annotations
 import argparse
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 
+from scripts._io import read_trades
 
-def _to_numeric(series: pd.Series) -> pd.Series:
-    return pd.to_numeric(series, errors="coerce")
 
+def _to_numeric(series: pd.Series) -> np.ndarray:
+    return pd.to_numeric(series, errors="coerce").to_numpy(dtype=np.float64)
 
-def _pick_column(df: pd.DataFrame, primary: str, fallback: str) -> pd.Series:
+
+def _pick_column(df: pd.DataFrame, primary: str, fallback: str) -> np.ndarray:
     if primary in df.columns:
         return _to_numeric(df[primary])
     if fallback in df.columns:
@@ -18,21 +21,39 @@ def _pick_column(df: pd.DataFrame, primary: str, fallback: str) -> pd.Series:
     raise ValueError(f"Missing required column: {primary} (or fallback: {fallback})")
 
 
-def _make_decile_table(data: pd.DataFrame) -> pd.DataFrame:
-    bucketed = data.copy()
-    bucketed["decile"] = (
-        pd.qcut(bucketed["imbalance"], q=10, labels=False, duplicates="drop").astype(int) + 1
-    )
-    table = (
-        bucketed.groupby("decile", observed=True)
-        .agg(
-            count=("r1", "size"),
-            mean_r1=("r1", "mean"),
-            hit_rate=("hit", "mean"),
-        )
-        .sort_index()
+def _pearson_ic(x: np.ndarray, y: np.ndarray) -> float:
+    # Centered dot products: same value as np.corrcoef without the stacked copy
+    # and 2x2 covariance matrix. Zero variance yields NaN.
+    if x.size < 2:
+        return float("nan")
+    xc = x - x.mean()
+    yc = y - y.mean()
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return float(np.dot(xc, yc) / np.sqrt(np.dot(xc, xc) * np.dot(yc, yc)))
+
+
+def _make_decile_table(imbalance: np.ndarray, r1: np.ndarray, hit: np.ndarray) -> pd.DataFrame:
+    # Same buckets as pd.qcut(q=10, duplicates="drop"): right-closed intervals over
+    # the unique linear-interpolated quantile edges, lowest value in the first bucket.
+    edges = np.unique(np.quantile(imbalance, np.linspace(0.0, 1.0, 11)))
+    if edges.size < 2:
+        raise ValueError("insufficient unique imbalance values for deciles")
+    n_buckets = edges.size - 1
+    bucket = np.searchsorted(edges[1:-1], imbalance, side="left")
+
+    counts = np.bincount(bucket, minlength=n_buckets)
+    sum_r1 = np.bincount(bucket, weights=r1, minlength=n_buckets)
+    sum_hit = np.bincount(bucket, weights=hit, minlength=n_buckets)
+    present = counts > 0
+    counts = counts[present]
+    return pd.DataFrame(
+        {
+            "count": counts,
+            "mean_r1": sum_r1[present] / counts,
+            "hit_rate": sum_hit[present] / counts,
+        },
+        index=pd.Index(np.flatnonzero(present) + 1, name="decile"),
     )
-    return table
 
 
 def _print_table(title: str, table: pd.DataFrame) -> None:
@@ -60,7 +81,7 @@ def main() -> None:
     if not csv_path.exists():
         raise FileNotFoundError(f"CSV not found: {csv_path}")
 
-    df = pd.read_csv(csv_path)
+    df = read_trades(csv_path)
     if "imbalance" not in df.columns:
         raise ValueError("Missing required column: imbalance")
 
@@ -72,52 +93,43 @@ def main() -> None:
     )
 
     mid = (best_bid + best_ask) / 2.0
-    r1 = mid.shift(-1) / mid - 1.0
-    hit = (
-        ((imbalance > 0) & (r1 > 0))
-        | ((imbalance < 0) & (r1 < 0))
-        | ((imbalance == 0) & (r1 == 0))
-    )
-
-    data = pd.DataFrame(
-        {
-            "imbalance": imbalance,
-            "mid": mid,
-            "spread": spread,
-            "r1": r1,
-            "hit": hit.astype(float),
-        }
-    )
-    data = data.dropna(subset=["imbalance", "mid", "r1"])
-    data = data[data["mid"] > 0]
-    if data.empty:
+    r1 = np.full(mid.shape, np.nan)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        r1[:-1] = mid[1:] / mid[:-1] - 1.0
+
+    valid = np.isfinite(imbalance) & np.isfinite(r1) & (mid > 0)
+    imbalance = imbalance[valid]
+    r1 = r1[valid]
+    spread = spread[valid]
+    if imbalance.size == 0:
         raise ValueError("No valid rows after cleaning. Check input CSV market fields.")
+    hit = (np.sign(imbalance) == np.sign(r1)).astype(np.float64)
 
-    ic = float(data["imbalance"].corr(data["r1"]))
-    print(f"rows={len(data)}")
+    ic = _pearson_ic(imbalance, r1)
+    print(f"rows={imbalance.size}")
     print(f"IC={ic:.8f}")
 
     try:
-        decile_table = _make_decile_table(data)
+        decile_table = _make_decile_table(imbalance, r1, hit)
     except ValueError:
         print("Decile table skipped: insufficient unique imbalance values.")
     else:
         _print_table("Deciles (all rows):", decile_table)
 
-    spread_data = data.dropna(subset=["spread"]).copy()
-    if spread_data["spread"].nunique() > 1:
-        spread_cut = float(spread_data["spread"].median())
+    has_spread = ~np.isnan(spread)
+    if np.unique(spread[has_spread]).size > 1:
+        spread_cut = float(np.median(spread[has_spread]))
         print(f"spread_median={spread_cut:.8f}")
-        spread_data["spread_regime"] = spread_data["spread"].map(
-            lambda x: "low_spread" if x <= spread_cut else "high_spread"
-        )
+        low_spread = spread <= spread_cut
 
-        for regime in ("low_spread", "high_spread"):
-            regime_rows = spread_data[spread_data["spread_regime"] == regime]
-            if regime_rows.empty:
+        for regime, mask in (
+            ("low_spread", has_spread & low_spread),
+            ("high_spread", has_spread & ~low_spread),
+        ):
+            if not mask.any():
                 continue
             try:
-                regime_table = _make_decile_table(regime_rows)
+                regime_table = _make_decile_table(imbalance[mask], r1[mask], hit[mask])
             except ValueError:
                 print(f"Decile table skipped for {regime}: insufficient unique values.")
                 continue
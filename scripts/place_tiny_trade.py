@@ -1,47 +1,48 @@
 import json
-import os
+from concurrent.futures import ThreadPoolExecutor
 
 from src.config import BASE_URL, API_KEY, API_SECRET
 from src.binance_client import BinanceClient
+from src.settings import dry_run_enabled
+from scripts._common import asset_balances
 
 SYMBOL = "BTCUSDT"
 
 
-def _dry_run_enabled() -> bool:
-    return os.getenv("DRY_RUN", "true").strip().lower() in {
-        "1",
-        "true",
-        "yes",
-        "y",
-        "on",
-    }
-
-
 def main():
     c = BinanceClient(base_url=BASE_URL, api_key=API_KEY, api_secret=API_SECRET)
-    dry_run = _dry_run_enabled()
+    dry_run = dry_run_enabled()
     print(f"DRY_RUN={dry_run}")
 
-    # 1) Snapshot balances before
-    acct_before = c.get("/v3/account", signed=True)
-    bal_before = {b["asset"]: (b["free"], b["locked"]) for b in acct_before["balances"]}
+    order_path = "/v3/order/test" if dry_run else "/v3/order"
+    order_params = {
+        "symbol": SYMBOL,
+        "side": "BUY",
+        "type": "MARKET",
+        "quoteOrderQty": "10",  # spend 10 USDT
+    }
 
-    print("\n--- BEFORE ---")
-    print("USDT:", bal_before.get("USDT"))
-    print("BTC :", bal_before.get("BTC"))
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        pending_order = None
+        if dry_run:
+            # order/test leaves balances untouched, so it can overlap the before
+            # snapshot. A real order must not start until that snapshot is taken.
+            pending_order = pool.submit(c.post, order_path, signed=True, params=order_params)
+
+        # 1) Snapshot balances before
+        acct_before = c.get("/v3/account", signed=True)
+        bal_before = asset_balances(acct_before)
+
+        print("\n--- BEFORE ---")
+        print("USDT:", bal_before.get("USDT"))
+        print("BTC :", bal_before.get("BTC"))
+
+        # 2) In DRY_RUN mode use order/test only. Real order requires DRY_RUN=false.
+        if pending_order is not None:
+            order = pending_order.result()
+        else:
+            order = c.post(order_path, signed=True, params=order_params)
 
-    # 2) In DRY_RUN mode use order/test only. Real order requires DRY_RUN=false.
-    order_path = "/v3/order/test" if dry_run else "/v3/order"
-    order = c.post(
-        order_path,
-        signed=True,
-        params={
-            "symbol": SYMBOL,
-            "side": "BUY",
-            "type": "MARKET",
-            "quoteOrderQty": "10",  # spend 10 USDT
-        },
-    )
     if dry_run:
         print("\nDRY_RUN active: used /v3/order/test (no balance changes expected).")
 
@@ -50,7 +51,7 @@ def main():
 
     # 3) Snapshot balances after
     acct_after = c.get("/v3/account", signed=True)
-    bal_after = {b["asset"]: (b["free"], b["locked"]) for b in acct_after["balances"]}
+    bal_after = asset_balances(acct_after)
 
     print("\n--- AFTER ---")
     print("USDT:", bal_after.get("USDT"))
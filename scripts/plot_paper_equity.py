@@ -4,8 +4,14 @@ import argparse
 from pathlib import Path
 
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
+from scripts._io import read_trades
+
+
+PLOT_COLUMNS = ["timestamp", "paper_equity_usdt", "paper_trade_notional_usdt"]
+
 
 def _require_column(df: pd.DataFrame, column: str) -> None:
     if column in df.columns:
@@ -35,7 +41,7 @@ def main() -> None:
     if not csv_path.exists():
         raise FileNotFoundError(f"CSV not found: {csv_path}")
 
-    df = pd.read_csv(csv_path)
+    df = read_trades(csv_path, columns=PLOT_COLUMNS)
     _require_column(df, "paper_equity_usdt")
 
     equity = pd.to_numeric(df["paper_equity_usdt"], errors="coerce")
@@ -90,8 +96,12 @@ def main() -> None:
     if args.drawdown_out:
         dd_path = Path(args.drawdown_out)
         dd_path.parent.mkdir(parents=True, exist_ok=True)
-        rolling_max = equity.cummax()
-        drawdown = equity - rolling_max
+        equity_arr = equity.to_numpy(dtype=np.float64)
+        # NaN rows (polls without paper equity) must not reset the running peak.
+        rolling_max = np.maximum.accumulate(
+            np.where(np.isnan(equity_arr), -np.inf, equity_arr)
+        )
+        drawdown = equity_arr - rolling_max
 
         fig_dd, ax_dd = plt.subplots(figsize=(12, 4))
         ax_dd.plot(x, drawdown, color="tab:orange", linewidth=1.5)
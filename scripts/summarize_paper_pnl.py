@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import argparse
+import csv
+from array import array
 from pathlib import Path
 
-import pandas as pd
+import numpy as np
 
 
 REQUIRED_COLUMNS = [
@@ -13,8 +15,32 @@ REQUIRED_COLUMNS = [
 ]
 
 
-def _safe_numeric(series: pd.Series) -> pd.Series:
-    return pd.to_numeric(series, errors="coerce")
+def _safe_float(value: str) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return float("nan")
+
+
+def _read_columns(csv_path: Path) -> dict[str, np.ndarray]:
+    with csv_path.open("r", newline="", encoding="utf-8") as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        missing = [c for c in REQUIRED_COLUMNS if c not in header]
+        if missing:
+            raise ValueError(f"Missing required paper columns: {missing}")
+
+        indices = [header.index(c) for c in REQUIRED_COLUMNS]
+        buffers = [array("d") for _ in REQUIRED_COLUMNS]
+        for row in reader:
+            width = len(row)
+            for idx, buf in zip(indices, buffers):
+                buf.append(_safe_float(row[idx]) if idx < width else float("nan"))
+
+    return {
+        column: np.frombuffer(buf, dtype=np.float64)
+        for column, buf in zip(REQUIRED_COLUMNS, buffers)
+    }
 
 
 def main() -> None:
@@ -27,23 +53,21 @@ def main() -> None:
     if not csv_path.exists():
         raise FileNotFoundError(f"CSV not found: {csv_path}")
 
-    df = pd.read_csv(csv_path)
-    missing = [c for c in REQUIRED_COLUMNS if c not in df.columns]
-    if missing:
-        raise ValueError(f"Missing required paper columns: {missing}")
-
-    trade_notional = _safe_numeric(df["paper_trade_notional_usdt"]).fillna(0.0)
-    equity = _safe_numeric(df["paper_equity_usdt"]).dropna()
-    pnl = _safe_numeric(df["paper_pnl_usdt"]).dropna()
-
-    total_paper_trades = int((trade_notional > 0).sum())
-    final_paper_equity = float(equity.iloc[-1]) if len(equity) else 0.0
-    final_paper_pnl = float(pnl.iloc[-1]) if len(pnl) else 0.0
-
-    if len(equity):
-        running_peak = equity.cummax()
-        drawdown = running_peak - equity
-        max_drawdown = float(drawdown.max())
+    columns = _read_columns(csv_path)
+    trade_notional = columns["paper_trade_notional_usdt"]
+    equity_all = columns["paper_equity_usdt"]
+    equity = equity_all[~np.isnan(equity_all)]
+    pnl = columns["paper_pnl_usdt"]
+    pnl = pnl[~np.isnan(pnl)]
+
+    # NaN > 0 is False, so missing notionals never count as trades.
+    total_paper_trades = int(np.count_nonzero(trade_notional > 0))
+    final_paper_equity = float(equity[-1]) if equity.size else 0.0
+    final_paper_pnl = float(pnl[-1]) if pnl.size else 0.0
+
+    if equity.size:
+        running_peak = np.maximum.accumulate(equity)
+        max_drawdown = float(np.max(running_peak - equity))
     else:
         max_drawdown = 0.0
 
@@ -59,9 +83,8 @@ def main() -> None:
             print("plot skipped: matplotlib is not installed")
             return
 
-        equity_plot = _safe_numeric(df["paper_equity_usdt"])
         plt.figure(figsize=(10, 4))
-        plt.plot(equity_plot.index, equity_plot.values)
+        plt.plot(np.arange(equity_all.size), equity_all)
         plt.title("Paper Equity Curve")
         plt.xlabel("Row")
         plt.ylabel("USDT")
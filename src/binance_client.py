@@ -1,11 +1,70 @@
 import hmac
 import hashlib
+import math
+import threading
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Dict, List, Tuple, Optional
-from urllib.parse import urlencode, quote
+from urllib.parse import quote
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    _loads = json.loads
+
+# Transient 5xx are retried only for idempotent methods: a retried POST /v3/order
+# could place a second order. 418/429 are left to the caller's backoff.
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.2,
+    status_forcelist=(500, 502, 503, 504),
+    allowed_methods=frozenset({"GET", "DELETE"}),
+    raise_on_status=False,
+)
+
+
+class BinanceHTTPError(RuntimeError):
+    # The message keeps the "<METHOD> <path> failed <status>: <body>" form callers parse.
+    def __init__(
+        self,
+        message: str,
+        status: int,
+        retry_after: Optional[float] = None,
+        code: Optional[int] = None,
+    ) -> None:
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+        # Binance error code from the {"code": ..., "msg": ...} body, e.g. -2011.
+        self.code = code
+
+
+def _parse_error_code(body: bytes) -> Optional[int]:
+    try:
+        payload = _loads(body) if body else None
+    except ValueError:
+        return None
+    code = payload.get("code") if isinstance(payload, dict) else None
+    return code if isinstance(code, int) else None
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    # Binance sends Retry-After in whole seconds on 418/429.
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        return None
+    return seconds if math.isfinite(seconds) and seconds >= 0 else None
 
 
 @dataclass
@@ -15,20 +74,76 @@ class BinanceClient:
     api_secret: str
     recv_window: int = 5000
     timeout: int = 10
+    pool_connections: int = 1
+    pool_maxsize: int = 4
+    _session: requests.Session = field(
+        default_factory=requests.Session, init=False, repr=False
+    )
+    _hmac_proto: Any = field(default=None, init=False, repr=False)
+    _last_request_at: float = field(default=0.0, init=False, repr=False)
+    _keepalive_stop: Optional[threading.Event] = field(default=None, init=False, repr=False)
+    # Serializes session use between the caller and the keepalive thread; a
+    # requests.Session is not guaranteed thread-safe.
+    _session_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # One pooled session keeps the TCP/TLS connection alive across polls.
+        adapter = HTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            max_retries=_RETRY,
+        )
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        self._session.headers["Connection"] = "keep-alive"
+        if self.api_key:
+            self._session.headers["X-MBX-APIKEY"] = self.api_key
+        # Key setup happens once; each signature clones the keyed state.
+        self._hmac_proto = hmac.new(
+            self.api_secret.encode("utf-8"), b"", hashlib.sha256
+        )
+
+    def close(self) -> None:
+        if self._keepalive_stop is not None:
+            self._keepalive_stop.set()
+            self._keepalive_stop = None
+        self._session.close()
+
+    def start_keepalive(self, interval_seconds: float) -> None:
+        # Background /v3/ping whenever the session has been idle for interval_seconds,
+        # so a long backoff or slow poll cadence does not start on a cold TLS connection.
+        if interval_seconds <= 0 or self._keepalive_stop is not None:
+            return
+        stop = threading.Event()
+        self._keepalive_stop = stop
+
+        def _run() -> None:
+            wait_for = interval_seconds
+            while not stop.wait(wait_for):
+                idle = time.monotonic() - self._last_request_at
+                if idle < interval_seconds:
+                    wait_for = interval_seconds - idle
+                    continue
+                try:
+                    self.request("GET", "/v3/ping")
+                except Exception:
+                    # Best effort: the next real request reconnects if this fails.
+                    pass
+                wait_for = interval_seconds
+
+        threading.Thread(target=_run, name="binance-keepalive", daemon=True).start()
 
     def _ts(self) -> int:
         return int(time.time() * 1000)
 
     def _encode(self, params: List[Tuple[str, Any]]) -> str:
         # Build the exact URL-encoded query string to be signed and sent
-        return urlencode([(k, str(v)) for k, v in params], quote_via=quote, safe="")
+        return "&".join([k + "=" + quote(str(v), safe="") for k, v in params])
 
     def _sign(self, query_string: str) -> str:
-        return hmac.new(
-            self.api_secret.encode("utf-8"),
-            query_string.encode("utf-8"),
-            hashlib.sha256,
-        ).hexdigest()
+        h = self._hmac_proto.copy()
+        h.update(query_string.encode("utf-8"))
+        return h.hexdigest()
 
     def request(
         self,
@@ -38,12 +153,10 @@ class BinanceClient:
         signed: bool = False,
     ) -> Any:
         params = params or {}
-        headers = {}
 
         if signed:
             if not self.api_key or not self.api_secret:
                 raise ValueError("Missing API key/secret for signed request")
-            headers["X-MBX-APIKEY"] = self.api_key
 
             items: List[Tuple[str, Any]] = list(params.items())
             items.append(("recvWindow", self.recv_window))
@@ -58,11 +171,19 @@ class BinanceClient:
         if qs:
             url = f"{url}?{qs}"
 
-        r = requests.request(method, url, headers=headers, timeout=self.timeout)
+        with self._session_lock:
+            self._last_request_at = time.monotonic()
+            r = self._session.request(method, url, timeout=self.timeout)
         # Raise useful errors
         if r.status_code >= 400:
-            raise RuntimeError(f"{method} {path} failed {r.status_code}: {r.text}")
-        return r.json() if r.text else {}
+            raise BinanceHTTPError(
+                f"{method} {path} failed {r.status_code}: {r.text}",
+                status=r.status_code,
+                retry_after=_parse_retry_after(r.headers.get("Retry-After")),
+                code=_parse_error_code(r.content),
+            )
+        body = r.content
+        return _loads(body) if body else {}
 
     # Convenience wrappers
     def get(
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 import math
-from collections import deque
-from dataclasses import dataclass
 from typing import Any, Optional
 
+import numpy as np
+
 from src.settings import RuntimeSettings
 
 WARMUP = "WARMUP"
@@ -15,13 +15,11 @@ MODE_WARMUP_THEN_TRADE = "warmup_then_trade"
 MODE_ROLLING_WALK_FORWARD = "rolling_walk_forward"
 
 
-@dataclass(frozen=True)
-class LabeledObservation:
-    imbalance: float
-    forward_return: float
-
-
 def _to_float(value: Any, default: float = 0.0) -> float:
+    if value is None:
+        return default
+    if type(value) is float:
+        return value
     try:
         return float(value)
     except (TypeError, ValueError):
@@ -34,14 +32,63 @@ def _safe_mid(best_bid: float, best_ask: float) -> float:
     return (best_bid + best_ask) / 2.0
 
 
-def _std_sample(values: list[float], mean: float) -> float:
-    n = len(values)
-    if n <= 1:
-        return 0.0
-    var = sum((x - mean) * (x - mean) for x in values) / (n - 1)
-    if var <= 0:
-        return 0.0
-    return math.sqrt(var)
+def _best_threshold(
+    imbalances: np.ndarray,
+    forward_returns: np.ndarray,
+    thetas: np.ndarray,
+    min_trades: int,
+    turnover_penalty_alpha: float,
+    window_size: int,
+) -> Optional[tuple[float, float, float, int, float]]:
+    # Returns (theta, score, score_adj, n, trade_rate) of the best grid point.
+    # Observations that trade at theta are exactly those with |imbalance| > theta,
+    # so after sorting by |imbalance| descending they form a prefix of the window
+    # and every theta is scored from prefix statistics of the signed returns.
+    # M2 uses Welford's update (x_k - mean_{k-1}) * (x_k - mean_k), vectorized
+    # over all prefixes, instead of the cancellation-prone sum(x^2) - n*mean^2.
+    n_obs = imbalances.shape[0]
+    abs_imbalance = np.abs(imbalances)
+    order = np.argsort(-abs_imbalance, kind="stable")
+    signed_returns = np.sign(imbalances)
+    signed_returns *= forward_returns
+    signed_returns = signed_returns[order]
+
+    prefix_sum = np.zeros(n_obs + 1, dtype=np.float64)
+    np.cumsum(signed_returns, out=prefix_sum[1:])
+    prefix_mean = prefix_sum / np.maximum(np.arange(n_obs + 1), 1)
+    prefix_m2 = np.zeros(n_obs + 1, dtype=np.float64)
+    np.cumsum(
+        (signed_returns - prefix_mean[:-1]) * (signed_returns - prefix_mean[1:]),
+        out=prefix_m2[1:],
+    )
+
+    abs_imbalance.sort()
+    n = n_obs - np.searchsorted(abs_imbalance, thetas, side="right")
+    valid = np.flatnonzero(n >= min_trades)
+    if valid.size == 0:
+        return None
+
+    n = n[valid]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mu = prefix_mean[n]
+        var = prefix_m2[n] / (n - 1)
+        sd = np.where((n > 1) & (var > 0), np.sqrt(var), 0.0)
+        score = np.where(
+            sd == 0.0,
+            np.where(mu > 0, np.inf, -np.inf),
+            mu / (sd / np.sqrt(n)),
+        )
+    trade_rate = n / window_size
+    score_adj = score - (turnover_penalty_alpha * trade_rate)
+
+    i = int(np.argmax(score_adj))
+    return (
+        float(thetas[valid[i]]),
+        float(score[i]),
+        float(score_adj[i]),
+        int(n[i]),
+        float(trade_rate[i]),
+    )
 
 
 class WalkForwardCalibrator:
@@ -56,12 +103,25 @@ class WalkForwardCalibrator:
         self.turnover_penalty_alpha = settings.calibration_turnover_penalty_alpha
         self.ema_lambda = settings.calibration_ema_lambda
         self.horizon_polls = settings.calibration_horizon_polls
+        self._grid = self._build_threshold_grid()
 
         self.state = WARMUP
         self.last_report: dict[str, Any] = {}
-
-        self._labeled_obs: deque[LabeledObservation] = deque(maxlen=self.window_size)
-        self._pending_obs: deque[tuple[float, float]] = deque()
+        # (theta_hat, score_adj, n) from last_report, refreshed only when it changes.
+        self._report_fields: tuple[Any, Any, Any] = ("", "", "")
+
+        # Labeled (imbalance, forward_return) pairs live in two ring buffers so the
+        # calibration kernel reads the window without copying it.
+        self._labeled_imbalance = np.empty(self.window_size, dtype=np.float64)
+        self._labeled_return = np.empty(self.window_size, dtype=np.float64)
+        self._labeled_next = 0
+        self._labeled_count = 0
+        # (imbalance, mid) awaiting their forward return, as a fixed-size ring.
+        pending_size = self.horizon_polls + 1
+        self._pending_imbalance = np.empty(pending_size, dtype=np.float64)
+        self._pending_mid = np.empty(pending_size, dtype=np.float64)
+        self._pending_head = 0
+        self._pending_count = 0
         self._theta_hat: Optional[float] = None
         self._theta_live: Optional[float] = None
         self._trade_polls_since_calibration = 0
@@ -77,18 +137,21 @@ class WalkForwardCalibrator:
         if mid <= 0:
             return
 
-        self._pending_obs.append((imbalance, mid))
-        if len(self._pending_obs) > self.horizon_polls:
-            prev_imbalance, prev_mid = self._pending_obs.popleft()
+        pending_size = self._pending_mid.shape[0]
+        slot = (self._pending_head + self._pending_count) % pending_size
+        self._pending_imbalance[slot] = imbalance
+        self._pending_mid[slot] = mid
+        self._pending_count += 1
+        if self._pending_count > self.horizon_polls:
+            head = self._pending_head
+            prev_imbalance = float(self._pending_imbalance[head])
+            prev_mid = float(self._pending_mid[head])
+            self._pending_head = (head + 1) % pending_size
+            self._pending_count -= 1
             if prev_mid > 0:
                 forward_return = (mid / prev_mid) - 1.0
                 if math.isfinite(prev_imbalance) and math.isfinite(forward_return):
-                    self._labeled_obs.append(
-                        LabeledObservation(
-                            imbalance=prev_imbalance,
-                            forward_return=forward_return,
-                        )
-                    )
+                    self._append_labeled(prev_imbalance, forward_return)
 
         if self.mode == MODE_WARMUP_THEN_TRADE:
             self._update_warmup_then_trade()
@@ -105,19 +168,31 @@ class WalkForwardCalibrator:
             self._trade_polls_since_calibration += 1
         return threshold
 
+    def snapshot_tuple(self) -> tuple[str, Any, Any, Any]:
+        # (state, theta_hat, score_adj, n) for the per-poll CSV row.
+        return (self.state, *self._report_fields)
+
+    def _append_labeled(self, imbalance: float, forward_return: float) -> None:
+        slot = self._labeled_next
+        self._labeled_imbalance[slot] = imbalance
+        self._labeled_return[slot] = forward_return
+        self._labeled_next = (slot + 1) % self.window_size
+        if self._labeled_count < self.window_size:
+            self._labeled_count += 1
+
     def _update_warmup_then_trade(self) -> None:
         if self._theta_live is not None:
             if self.state != CALIBRATING:
                 self.state = TRADING
             return
-        if len(self._labeled_obs) < self.window_size:
+        if self._labeled_count < self.window_size:
             self.state = WARMUP
             return
         self._attempt_calibration()
 
     def _update_rolling_walk_forward(self) -> None:
         if self._theta_live is None:
-            if len(self._labeled_obs) < self.window_size:
+            if self._labeled_count < self.window_size:
                 self.state = WARMUP
                 return
             self._attempt_calibration()
@@ -133,6 +208,11 @@ class WalkForwardCalibrator:
     def _attempt_calibration(self) -> None:
         report = self._calibrate_threshold()
         self.last_report = report
+        self._report_fields = (
+            report.get("theta_hat", ""),
+            report.get("score_adj", ""),
+            report.get("n", ""),
+        )
 
         theta_hat = report.get("theta_hat")
         if theta_hat is None:
@@ -157,65 +237,39 @@ class WalkForwardCalibrator:
         self.last_report["theta_live"] = self._theta_live
 
     def _calibrate_threshold(self) -> dict[str, Any]:
-        observations = list(self._labeled_obs)
-        if len(observations) < self.window_size:
+        n_obs = self._labeled_count
+        if n_obs < self.window_size:
             return {
                 "theta_hat": None,
                 "score": float("-inf"),
                 "score_adj": float("-inf"),
                 "n": 0,
                 "trade_rate": 0.0,
-                "window_obs": len(observations),
+                "window_obs": n_obs,
                 "reason": "insufficient_window",
             }
 
         grid = self._threshold_grid()
-        if not grid:
+        if grid.size == 0:
             return {
                 "theta_hat": None,
                 "score": float("-inf"),
                 "score_adj": float("-inf"),
                 "n": 0,
                 "trade_rate": 0.0,
-                "window_obs": len(observations),
+                "window_obs": n_obs,
                 "reason": "empty_grid",
             }
 
-        best: Optional[dict[str, Any]] = None
-        for theta in grid:
-            n = 0
-            signed_returns: list[float] = []
-            for obs in observations:
-                if obs.imbalance > theta:
-                    signed_returns.append(obs.forward_return)
-                    n += 1
-                elif obs.imbalance < -theta:
-                    signed_returns.append(-obs.forward_return)
-                    n += 1
-
-            if n < self.min_trades:
-                continue
-
-            mu = sum(signed_returns) / n
-            sd = _std_sample(signed_returns, mean=mu)
-            if sd == 0.0:
-                score = float("inf") if mu > 0 else float("-inf")
-            else:
-                score = mu / (sd / math.sqrt(n))
-            trade_rate = n / self.window_size
-            score_adj = score - (self.turnover_penalty_alpha * trade_rate)
-
-            candidate = {
-                "theta_hat": theta,
-                "score": score,
-                "score_adj": score_adj,
-                "n": n,
-                "trade_rate": trade_rate,
-                "window_obs": len(observations),
-                "reason": "ok",
-            }
-            if best is None or candidate["score_adj"] > best["score_adj"]:
-                best = candidate
+        # The kernel is order-independent, so the ring buffers are passed as-is.
+        best = _best_threshold(
+            imbalances=self._labeled_imbalance,
+            forward_returns=self._labeled_return,
+            thetas=grid,
+            min_trades=self.min_trades,
+            turnover_penalty_alpha=self.turnover_penalty_alpha,
+            window_size=self.window_size,
+        )
 
         if best is None:
             return {
@@ -224,19 +278,28 @@ class WalkForwardCalibrator:
                 "score_adj": float("-inf"),
                 "n": 0,
                 "trade_rate": 0.0,
-                "window_obs": len(observations),
+                "window_obs": n_obs,
                 "reason": "no_valid_candidate",
             }
-        return best
-
-    def _threshold_grid(self) -> list[float]:
-        grid: list[float] = []
-        theta = self.grid_min
+        theta_hat, score, score_adj, n, trade_rate = best
+        return {
+            "theta_hat": theta_hat,
+            "score": score,
+            "score_adj": score_adj,
+            "n": n,
+            "trade_rate": trade_rate,
+            "window_obs": n_obs,
+            "reason": "ok",
+        }
+
+    def _threshold_grid(self) -> np.ndarray:
+        return self._grid
+
+    def _build_threshold_grid(self) -> np.ndarray:
+        # theta_k = grid_min + k * step avoids the drift of repeated += step.
         max_steps = 10000
-        steps = 0
-        while theta <= (self.grid_max + 1e-12) and steps < max_steps:
-            if theta > 0:
-                grid.append(round(theta, 10))
-            theta += self.grid_step
-            steps += 1
-        return grid
+        n_steps = int(math.floor((self.grid_max - self.grid_min) / self.grid_step + 1e-9)) + 1
+        n_steps = max(0, min(n_steps, max_steps))
+        grid = self.grid_min + np.arange(n_steps, dtype=np.float64) * self.grid_step
+        grid = grid[(grid > 0) & (grid <= self.grid_max + 1e-12)]
+        return np.round(grid, 10)
@@ -1,15 +1,25 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Dict, Tuple
 
-from src.binance_client import BinanceClient
+from src.binance_client import BinanceClient, BinanceHTTPError
 from src.risk import TradeDecision
 from src.settings import RuntimeSettings
 from src.strategy import BUY, HOLD, SELL
 
+# action_taken labels per side, built once instead of formatted per decision.
+SKIP_ACTION = {side: f"SKIP_{side}" for side in (BUY, SELL, HOLD)}
+DRY_RUN_ACTION = {side: f"DRY_RUN_{side}" for side in (BUY, SELL, HOLD)}
+ERROR_ACTION = {side: f"ERROR_{side}" for side in (BUY, SELL, HOLD)}
 
-@dataclass(frozen=True)
+# Binance error codes/statuses cancel_all_open_orders distinguishes.
+_UNKNOWN_ORDER_CODE = -2011
+_UNSUPPORTED_OPERATION_CODE = -1020
+_ENDPOINT_UNSUPPORTED_STATUSES = frozenset({404, 405})
+
+
+@dataclass(frozen=True, slots=True)
 class OrderResult:
     action_taken: str
     approved: bool
@@ -22,9 +32,15 @@ class OrderResult:
     error: str = ""
     placed: bool = False
     filled: bool = False
+    # commissionAsset -> total commission across the response's fills.
+    commissions: Dict[str, float] = field(default_factory=dict)
 
 
 def _to_float(value: Any, default: float = 0.0) -> float:
+    if value is None:
+        return default
+    if type(value) is float:
+        return value
     try:
         return float(value)
     except (TypeError, ValueError):
@@ -32,7 +48,11 @@ def _to_float(value: Any, default: float = 0.0) -> float:
 
 
 def _format_qty(value: float) -> str:
-    return f"{value:.8f}".rstrip("0").rstrip(".")
+    # Fixed-point only: Binance rejects exponent forms such as "1e-05".
+    text = f"{value:.8f}"
+    if text[-1] != "0":
+        return text
+    return text.rstrip("0").rstrip(".")
 
 
 def _avg_fill_from_order(order: Dict[str, Any]) -> float:
@@ -55,6 +75,15 @@ def _avg_fill_from_order(order: Dict[str, Any]) -> float:
     return 0.0
 
 
+def _commissions_from_order(order: Dict[str, Any]) -> Dict[str, float]:
+    commissions: Dict[str, float] = {}
+    for fill in order.get("fills") or []:
+        asset = fill.get("commissionAsset")
+        if asset:
+            commissions[asset] = commissions.get(asset, 0.0) + _to_float(fill.get("commission"))
+    return commissions
+
+
 def get_account_balances(
     client: BinanceClient,
     base_asset: str,
@@ -84,14 +113,14 @@ def execute_trade_decision(
 
     if not decision.approved:
         return OrderResult(
-            action_taken=f"SKIP_{decision.side}",
+            action_taken=SKIP_ACTION[decision.side],
             approved=False,
             reject_reason=decision.reject_reason,
         )
 
     if settings.dry_run:
         return OrderResult(
-            action_taken=f"DRY_RUN_{decision.side}",
+            action_taken=DRY_RUN_ACTION[decision.side],
             approved=True,
             reject_reason="",
             order_id="SIMULATED",
@@ -129,12 +158,31 @@ def execute_trade_decision(
         avg_fill_px=avg_fill,
         placed=True,
         filled=(status == "FILLED"),
+        commissions=_commissions_from_order(order),
     )
 
 
 def cancel_all_open_orders(
     client: BinanceClient,
     symbol: str,
+) -> int:
+    # One symbol-level DELETE cancels everything; -2011 means nothing was open.
+    # Only an unsupported endpoint falls back to per-order cancels: rate limits,
+    # auth and network errors propagate rather than sending more requests.
+    try:
+        canceled = client.delete("/v3/openOrders", signed=True, params={"symbol": symbol})
+    except BinanceHTTPError as exc:
+        if exc.code == _UNKNOWN_ORDER_CODE:
+            return 0
+        if exc.status in _ENDPOINT_UNSUPPORTED_STATUSES or exc.code == _UNSUPPORTED_OPERATION_CODE:
+            return _cancel_open_orders_one_by_one(client, symbol)
+        raise
+    return len(canceled) if isinstance(canceled, list) else 0
+
+
+def _cancel_open_orders_one_by_one(
+    client: BinanceClient,
+    symbol: str,
 ) -> int:
     open_orders = client.get("/v3/openOrders", signed=True, params={"symbol": symbol})
     canceled = 0
@@ -149,7 +197,10 @@ def cancel_all_open_orders(
                 params={"symbol": symbol, "orderId": order_id},
             )
             canceled += 1
-        except Exception:
+        except Exception as exc:
+            if isinstance(exc, BinanceHTTPError) and exc.status in (418, 429):
+                # Rate limited: further DELETEs would only extend the limit.
+                break
             # Best effort: continue canceling remaining orders.
             continue
     return canceled
@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import atexit
 import csv
+import operator
+import queue
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 
 CSV_FIELDS = [
@@ -51,27 +56,154 @@ CSV_FIELDS = [
 ]
 
 
+_CLOSE = object()
+_FLUSH_DUE = object()
+# orderId values that do not come from the exchange (no order / dry run).
+_NON_EXCHANGE_ORDER_IDS = frozenset({"", "SIMULATED"})
+_HEADER_BYTES = ",".join(CSV_FIELDS).encode("utf-8")
+
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") of the last timestamp formatted; replaced
+# as one tuple so a concurrent reader never sees a mismatched pair.
+_second_prefix: tuple[int, str] = (-1, "")
+
+
+def format_timestamp_ns(ts_ns: int) -> str:
+    # Same text as datetime.now(timezone.utc).isoformat(), from integer nanoseconds,
+    # without building a datetime. isoformat() omits a zero microsecond field.
+    global _second_prefix
+    seconds, ns = divmod(ts_ns, 1_000_000_000)
+    cached_seconds, stamp = _second_prefix
+    if seconds != cached_seconds:
+        t = time.gmtime(seconds)
+        stamp = (
+            f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+            f"T{t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}"
+        )
+        _second_prefix = (seconds, stamp)
+    micros = ns // 1000
+    if micros:
+        return f"{stamp}.{micros:06d}+00:00"
+    return f"{stamp}+00:00"
+
+
 class TradeCsvLogger:
-    def __init__(self, path: str = "outputs/trades.csv") -> None:
+    def __init__(
+        self,
+        path: str = "outputs/trades.csv",
+        flush_every: int = 20,
+        flush_interval: float = 5.0,
+    ) -> None:
         self.path = Path(path)
         self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.flush_every = max(1, flush_every)
+        self.flush_interval = max(0.0, flush_interval)
         self._ensure_header()
+        # append() only snapshots the row and enqueues it; a daemon thread owns the
+        # buffered handle and writes, flushing every flush_every rows or once the
+        # oldest buffered row is flush_interval seconds old, after order rows, and
+        # on close().
+        self._fh = self.path.open("a", newline="", encoding="utf-8", buffering=1 << 16)
+        self._writer = csv.writer(self._fh)
+        self._fields = tuple(CSV_FIELDS)
+        # Rows from run_live carry every column, so one C-level itemgetter call
+        # orders them; anything partial takes the per-field .get() path.
+        self._row_values = operator.itemgetter(*self._fields)
+        self._order_id_index = self._fields.index("orderId")
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._error: Optional[BaseException] = None
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._drain, name="trade-csv-writer", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
 
     def append(self, row: Dict[str, Any]) -> None:
-        data = {field: row.get(field, "") for field in CSV_FIELDS}
-        with self.path.open("a", newline="", encoding="utf-8") as f:
-            writer = csv.DictWriter(f, fieldnames=CSV_FIELDS)
-            writer.writerow(data)
+        if self._closed:
+            raise ValueError("TradeCsvLogger is closed")
+        if self._error is not None:
+            raise self._error
+        try:
+            values = list(self._row_values(row))
+        except KeyError:
+            get = row.get
+            values = [get(field, "") for field in self._fields]
+        self._queue.put(values)
+
+    def flush(self) -> None:
+        # Blocks until every row appended so far has been written and flushed.
+        if self._closed:
+            return
+        done = threading.Event()
+        self._queue.put(done)
+        done.wait()
+        if self._error is not None:
+            raise self._error
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(_CLOSE)
+        self._thread.join()
+        self._fh.close()
+        atexit.unregister(self.close)
+        if self._error is not None:
+            raise self._error
+
+    def _drain(self) -> None:
+        unflushed = 0
+        flush_deadline = 0.0
+        while True:
+            timeout = max(0.0, flush_deadline - time.monotonic()) if unflushed else None
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                item = _FLUSH_DUE
+            try:
+                if item is _CLOSE:
+                    self._fh.flush()
+                    return
+                if item is _FLUSH_DUE:
+                    self._fh.flush()
+                    unflushed = 0
+                    continue
+                if isinstance(item, threading.Event):
+                    self._fh.flush()
+                    unflushed = 0
+                    item.set()
+                    continue
+                if type(item[0]) is int:
+                    item[0] = format_timestamp_ns(item[0])
+                self._writer.writerow(item)
+                if not unflushed:
+                    flush_deadline = time.monotonic() + self.flush_interval
+                unflushed += 1
+                # Rows carrying an exchange orderId go to disk right away.
+                if (
+                    unflushed >= self.flush_every
+                    or item[self._order_id_index] not in _NON_EXCHANGE_ORDER_IDS
+                ):
+                    self._fh.flush()
+                    unflushed = 0
+            except Exception as exc:
+                # Surfaced to the caller on the next append/flush/close.
+                self._error = exc
+                if item is _CLOSE:
+                    return
+                if isinstance(item, threading.Event):
+                    item.set()
 
     def _ensure_header(self) -> None:
         if (not self.path.exists()) or self.path.stat().st_size == 0:
             self._write_header()
             return
 
-        with self.path.open("r", newline="", encoding="utf-8") as f:
-            first_line = f.readline().strip()
-        current_header = ",".join(CSV_FIELDS)
-        if first_line == current_header:
+        # Only the header's own bytes plus one line-ending byte are read.
+        with self.path.open("rb") as f:
+            head = f.read(len(_HEADER_BYTES) + 1)
+        if head.rstrip(b"\r\n") == _HEADER_BYTES:
             return
 
         stamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
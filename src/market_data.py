@@ -1,14 +1,16 @@
 from __future__ import annotations
 
+import time
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional, Tuple
 
+import numpy as np
+
 from src.binance_client import BinanceClient
 from src.settings import RuntimeSettings
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SymbolFilters:
     symbol: str
     base_asset: str
@@ -19,9 +21,9 @@ class SymbolFilters:
     min_notional: float
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class MarketSnapshot:
-    timestamp: str
+    timestamp: int  # ns since the epoch; TradeCsvLogger formats it as ISO-8601
     bid: float
     ask: float
     mid: float
@@ -32,6 +34,10 @@ class MarketSnapshot:
 
 
 def _to_float(value: Any, default: float = 0.0) -> float:
+    if value is None:
+        return default
+    if type(value) is float:
+        return value
     try:
         return float(value)
     except (TypeError, ValueError):
@@ -52,19 +58,45 @@ def _imbalance_ratio(bid_qty: float, ask_qty: float) -> float:
     return (bid_qty - ask_qty) / denom
 
 
+# Exchange filters change rarely; (base_url, symbol) -> (fetched_at, filters).
+FILTERS_CACHE_TTL_SECONDS = 3600.0
+_filters_cache: Dict[Tuple[str, str], Tuple[float, SymbolFilters]] = {}
+
+
 def get_exchange_filters(client: BinanceClient, symbol: str) -> SymbolFilters:
+    key = (client.base_url, symbol)
+    now = time.monotonic()
+    cached = _filters_cache.get(key)
+    if cached is not None and (now - cached[0]) < FILTERS_CACHE_TTL_SECONDS:
+        return cached[1]
+    filters = _fetch_exchange_filters(client, symbol)
+    _filters_cache[key] = (now, filters)
+    return filters
+
+
+def _fetch_exchange_filters(client: BinanceClient, symbol: str) -> SymbolFilters:
     info = client.get("/v3/exchangeInfo", params={"symbol": symbol})
     symbols = info.get("symbols") or []
     if not symbols:
         raise RuntimeError(f"No exchangeInfo returned for symbol={symbol}")
 
     symbol_info = symbols[0]
-    filter_map: Dict[str, Dict[str, Any]] = {
-        f.get("filterType", ""): f for f in symbol_info.get("filters", [])
-    }
-    market_lot_filter = filter_map.get("MARKET_LOT_SIZE") or {}
-    lot_filter = filter_map.get("LOT_SIZE") or {}
-    notional_filter = filter_map.get("MIN_NOTIONAL") or filter_map.get("NOTIONAL") or {}
+    market_lot_filter: Dict[str, Any] = {}
+    lot_filter: Dict[str, Any] = {}
+    min_notional_filter: Dict[str, Any] = {}
+    notional_filter: Dict[str, Any] = {}
+    for f in symbol_info.get("filters", []):
+        filter_type = f.get("filterType")
+        if filter_type == "MARKET_LOT_SIZE":
+            market_lot_filter = f
+        elif filter_type == "LOT_SIZE":
+            lot_filter = f
+        elif filter_type == "MIN_NOTIONAL":
+            min_notional_filter = f
+        elif filter_type == "NOTIONAL":
+            notional_filter = f
+    # MIN_NOTIONAL takes precedence when a symbol still lists both.
+    notional_filter = min_notional_filter or notional_filter
 
     min_notional = _to_float(
         notional_filter.get("minNotional", notional_filter.get("notional", 0))
@@ -110,15 +142,34 @@ def compute_depth_imbalance(
 def compute_depth_qty_sums(
     bids: List[List[str]], asks: List[List[str]], levels: int
 ) -> Tuple[float, float]:
-    top_bids: List[Tuple[float, float]] = [
-        (_to_float(px), _to_float(qty)) for px, qty in bids[:levels]
-    ]
-    top_asks: List[Tuple[float, float]] = [
-        (_to_float(px), _to_float(qty)) for px, qty in asks[:levels]
-    ]
-    bid_sum = sum(qty for _, qty in top_bids)
-    ask_sum = sum(qty for _, qty in top_asks)
-    return bid_sum, ask_sum
+    return (
+        _level_qty_sum(depth_levels_array(bids, levels)),
+        _level_qty_sum(depth_levels_array(asks, levels)),
+    )
+
+
+def depth_levels_array(book_side: List[List[str]], levels: int) -> np.ndarray:
+    # Top levels as an (n, 2) float64 [price, qty] array, converted in one C pass.
+    top = book_side[:levels]
+    if not top:
+        return np.empty((0, 2), dtype=np.float64)
+    try:
+        arr = np.asarray(top, dtype=np.float64)
+    except (TypeError, ValueError):
+        arr = None
+    if arr is not None and arr.ndim == 2 and arr.shape[1] == 2 and np.isfinite(arr).all():
+        return arr
+    # Malformed levels: coerce per element, then zero anything non-finite
+    # ("nan"/"inf" parse cleanly) so bad values count as zero.
+    arr = np.array(
+        [(_to_float(px), _to_float(qty)) for px, qty in top], dtype=np.float64
+    )
+    arr[~np.isfinite(arr)] = 0.0
+    return arr
+
+
+def _level_qty_sum(levels_arr: np.ndarray) -> float:
+    return float(levels_arr[:, 1].sum())
 
 
 def get_market_snapshot(
@@ -126,33 +177,22 @@ def get_market_snapshot(
     symbol: str,
     settings: RuntimeSettings,
 ) -> MarketSnapshot:
-    bt = get_book_ticker(client, symbol=symbol)
-    bid = _to_float(bt.get("bidPrice"))
-    ask = _to_float(bt.get("askPrice"))
-    bid_qty = _to_float(bt.get("bidQty"))
-    ask_qty = _to_float(bt.get("askQty"))
-    mid = (bid + ask) / 2 if bid > 0 and ask > 0 else 0.0
-    imbalance = _imbalance_ratio(bid_qty, ask_qty)
     depth_update_id: Optional[int] = None
 
     if settings.use_depth:
+        # /v3/depth already carries the top of book, so bookTicker is skipped.
         depth = get_depth(client, symbol=symbol, limit=settings.depth_levels)
         depth_update_id = _to_int(depth.get("lastUpdateId"))
-        depth_bids = depth.get("bids", [])
-        depth_asks = depth.get("asks", [])
-        bid_qty, ask_qty = compute_depth_qty_sums(
-            bids=depth_bids,
-            asks=depth_asks,
-            levels=settings.depth_levels,
-        )
+        bid_levels = depth_levels_array(depth.get("bids", []), settings.depth_levels)
+        ask_levels = depth_levels_array(depth.get("asks", []), settings.depth_levels)
+        bid = float(bid_levels[0, 0]) if bid_levels.shape[0] else 0.0
+        ask = float(ask_levels[0, 0]) if ask_levels.shape[0] else 0.0
+        bid_qty = _level_qty_sum(bid_levels)
+        ask_qty = _level_qty_sum(ask_levels)
         imbalance = _imbalance_ratio(bid_qty, ask_qty)
         if settings.debug_depth_sums:
-            first_level_bid_qty = (
-                _to_float(depth_bids[0][1]) if depth_bids and len(depth_bids[0]) > 1 else 0.0
-            )
-            first_level_ask_qty = (
-                _to_float(depth_asks[0][1]) if depth_asks and len(depth_asks[0]) > 1 else 0.0
-            )
+            first_level_bid_qty = float(bid_levels[0, 1]) if bid_levels.shape[0] else 0.0
+            first_level_ask_qty = float(ask_levels[0, 1]) if ask_levels.shape[0] else 0.0
             print(
                 "DEPTH_DEBUG:"
                 f" levels={settings.depth_levels}"
@@ -162,9 +202,17 @@ def get_market_snapshot(
                 f" first_level_bid_qty={first_level_bid_qty:.8f}"
                 f" first_level_ask_qty={first_level_ask_qty:.8f}"
             )
+    else:
+        bt = get_book_ticker(client, symbol=symbol)
+        bid = _to_float(bt.get("bidPrice"))
+        ask = _to_float(bt.get("askPrice"))
+        bid_qty = _to_float(bt.get("bidQty"))
+        ask_qty = _to_float(bt.get("askQty"))
+        imbalance = _imbalance_ratio(bid_qty, ask_qty)
 
+    mid = (bid + ask) / 2 if bid > 0 and ask > 0 else 0.0
     return MarketSnapshot(
-        timestamp=datetime.now(timezone.utc).isoformat(),
+        timestamp=time.time_ns(),
         bid=bid,
         ask=ask,
         mid=mid,
@@ -1,13 +1,13 @@
 from __future__ import annotations
 
 import math
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from src.settings import RuntimeSettings
 from src.strategy import BUY, SELL
 
 
-@dataclass
+@dataclass(slots=True)
 class PaperTradeResult:
     traded: bool = False
     side: str = ""
@@ -18,7 +18,7 @@ class PaperTradeResult:
     trade_pnl_usdt: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class PaperLedger:
     paper_usdt: float
     paper_btc: float
@@ -29,26 +29,37 @@ class PaperLedger:
     win_count: int = 0
     equity_peak_usdt: float = 0.0
     max_drawdown_usdt: float = 0.0
+    # Last mark_to_market inputs and result. Peak/drawdown are already up to date
+    # for those inputs, so a repeat call returns the stored tuple.
+    _mtm_key: tuple[float, float, float] = field(
+        default=(math.nan, math.nan, math.nan), init=False, repr=False, compare=False
+    )
+    _mtm_result: tuple[float, float] = field(
+        default=(0.0, 0.0), init=False, repr=False, compare=False
+    )
 
     def mark_to_market(self, mid: float) -> tuple[float, float]:
+        key = (mid, self.paper_usdt, self.paper_btc)
+        if key == self._mtm_key:
+            return self._mtm_result
+        # paper_usdt/paper_btc are checked where they change (create + trade).
         _ensure_finite("mid", mid)
-        _ensure_finite("paper_usdt", self.paper_usdt)
-        _ensure_finite("paper_btc", self.paper_btc)
         equity = self.paper_usdt + self.paper_btc * mid
         if equity > self.equity_peak_usdt:
             self.equity_peak_usdt = equity
         drawdown = self.equity_peak_usdt - equity
         if drawdown > self.max_drawdown_usdt:
             self.max_drawdown_usdt = drawdown
-        pnl = equity - self.initial_equity_usdt
         _ensure_finite("paper_equity_usdt", equity)
-        _ensure_finite("paper_pnl_usdt", pnl)
-        return equity, pnl
+        result = (equity, equity - self.initial_equity_usdt)
+        self._mtm_key = key
+        self._mtm_result = result
+        return result
 
 
 def create_paper_ledger(settings: RuntimeSettings, initial_mid: float) -> PaperLedger:
     initial_equity = settings.paper_start_usdt + settings.paper_start_btc * initial_mid
-    return PaperLedger(
+    ledger = PaperLedger(
         paper_usdt=settings.paper_start_usdt,
         paper_btc=settings.paper_start_btc,
         fee_rate=settings.paper_fee_rate,
@@ -56,6 +67,8 @@ def create_paper_ledger(settings: RuntimeSettings, initial_mid: float) -> PaperL
         initial_equity_usdt=initial_equity,
         equity_peak_usdt=initial_equity,
     )
+    _ensure_finite_ledger(ledger)
+    return ledger
 
 
 def _ensure_finite(name: str, value: float) -> None:
@@ -104,7 +117,6 @@ def apply_dry_run_trade(
     if exec_px <= 0:
         return PaperTradeResult(side=side, exec_px=exec_px)
 
-    _ensure_finite_ledger(ledger)
     before_equity = ledger.paper_usdt + ledger.paper_btc * mid
 
     if side == BUY:
@@ -1,9 +1,8 @@
 from __future__ import annotations
 
 import math
-from dataclasses import dataclass
-from decimal import Decimal, ROUND_DOWN
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import Callable, Optional
 
 from src.market_data import SymbolFilters
 from src.settings import RuntimeSettings
@@ -19,9 +18,21 @@ class RiskConfig:
     max_consecutive_errors: int
     enable_position_sizing: bool
     position_sizing_mode: str
+    # Bound once from position_sizing_mode so sizing skips the string compare per poll.
+    sizing_scale: Callable[[float, float], float] = field(
+        init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        scale_fn = (
+            _linear_abs_scale
+            if self.position_sizing_mode == "linear_abs"
+            else _linear_excess_scale
+        )
+        object.__setattr__(self, "sizing_scale", scale_fn)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TradeDecision:
     side: str
     approved: bool
@@ -43,17 +54,18 @@ def risk_config_from_settings(settings: RuntimeSettings) -> RiskConfig:
     )
 
 
-def _to_decimal(value: float) -> Decimal:
-    return Decimal(str(value))
-
-
 def round_down_step(quantity: float, step_size: float) -> float:
     if step_size <= 0:
         return max(quantity, 0.0)
-    q = _to_decimal(max(quantity, 0.0))
-    step = _to_decimal(step_size)
-    units = (q / step).quantize(Decimal("1"), rounding=ROUND_DOWN)
-    return float(units * step)
+    # Start from the nearest whole step so binary drift (0.3 / 0.1 = 2.999...)
+    # cannot lose a step, then step back once if that lands above the quantity.
+    # 15 significant digits drops the last-ulp noise of units * step.
+    quantity = max(quantity, 0.0)
+    units = round(quantity / step_size)
+    rounded = float(f"{units * step_size:.15g}")
+    if rounded > quantity:
+        rounded = float(f"{(units - 1) * step_size:.15g}")
+    return rounded
 
 
 def _cooldown_active(
@@ -64,8 +76,16 @@ def _cooldown_active(
     return (now_ts - last_trade_ts) < cooldown_seconds
 
 
-def _clamp(value: float, lower: float, upper: float) -> float:
-    return max(lower, min(value, upper))
+def _linear_abs_scale(abs_imb: float, threshold_used: float) -> float:
+    return abs_imb
+
+
+def _linear_excess_scale(abs_imb: float, threshold_used: float) -> float:
+    denom = 1.0 - threshold_used
+    if denom <= 0.0:
+        return 0.0
+    # max(0, min(x, 1)) in this order sends a NaN ratio to 0.0.
+    return max(0.0, min((abs_imb - threshold_used) / denom, 1.0))
 
 
 def compute_notional_target_usdt(
@@ -79,17 +99,9 @@ def compute_notional_target_usdt(
     if not math.isfinite(imbalance):
         return float("nan")
 
-    abs_imb = _clamp(abs(imbalance), 0.0, 1.0)
-    if cfg.position_sizing_mode == "linear_abs":
-        scale = abs_imb
-    else:
-        denom = 1.0 - threshold_used
-        if denom <= 0.0:
-            scale = 0.0
-        else:
-            scale = _clamp((abs_imb - threshold_used) / denom, 0.0, 1.0)
-
-    return _clamp(cfg.max_notional_per_trade_usdt * scale, 0.0, cfg.max_notional_per_trade_usdt)
+    max_notional = cfg.max_notional_per_trade_usdt
+    scale = cfg.sizing_scale(min(abs(imbalance), 1.0), threshold_used)
+    return max(0.0, min(max_notional * scale, max_notional))
 
 
 def evaluate_pending_signal(
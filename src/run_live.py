@@ -1,74 +1,60 @@
 from __future__ import annotations
 
 import re
+import signal
+import sys
 import time
-from collections import deque
-from datetime import datetime, timezone
-from typing import Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Optional
 
-from src.binance_client import BinanceClient
+from src.binance_client import BinanceClient, BinanceHTTPError
 from src.calibration import WalkForwardCalibrator
 from src.config import API_KEY, API_SECRET, BASE_URL
-from src.execution import cancel_all_open_orders, execute_trade_decision, get_account_balances
-from src.logger import TradeCsvLogger
-from src.market_data import get_exchange_filters, get_market_snapshot
+from src.execution import (
+    ERROR_ACTION,
+    SKIP_ACTION,
+    OrderResult,
+    cancel_all_open_orders,
+    execute_trade_decision,
+    get_account_balances,
+)
+from src.logger import CSV_FIELDS, TradeCsvLogger
+from src.market_data import SymbolFilters, get_exchange_filters, get_market_snapshot
 from src.paper import apply_dry_run_trade, create_paper_ledger
 from src.risk import TradeDecision, evaluate_pending_signal, risk_config_from_settings
 from src.settings import RuntimeSettings, load_runtime_settings
-from src.strategy import BUY, HOLD, SELL, signal_from_imbalance
+from src.strategy import BUY, HOLD, SELL, ConfirmationCounter, signal_from_imbalance
 
 
-def _extract_http_status(message: str) -> Optional[int]:
-    match = re.search(r"failed\s+(\d{3})", message)
+_HTTP_STATUS_RE = re.compile(r"failed\s+(\d{3})")
+
+
+def _extract_http_status(
+    exc: Exception, message: str
+) -> tuple[Optional[int], Optional[float]]:
+    # (status, Retry-After seconds); other exceptions fall back to the message text.
+    if isinstance(exc, BinanceHTTPError):
+        return exc.status, exc.retry_after
+    if "failed" not in message:
+        return None, None
+    match = _HTTP_STATUS_RE.search(message)
     if match:
-        return int(match.group(1))
-    return None
-
-
-def _base_row(ts: str, pending_signal_prev: str) -> dict:
-    return {
-        "timestamp": ts,
-        "best_bid": "",
-        "best_ask": "",
-        "bid": "",
-        "ask": "",
-        "mid": "",
-        "spread": "",
-        "bid_qty": "",
-        "ask_qty": "",
-        "imbalance": "",
-        "sizing_enabled": "",
-        "sizing_mode": "",
-        "notional_target_usdt": "",
-        "notional_min_usdt": "",
-        "stale_repeats": "",
-        "depth_update_id": "",
-        "threshold_used": "",
-        "calib_state": "",
-        "theta_hat": "",
-        "calib_score": "",
-        "calib_n": "",
-        "signal_t": "",
-        "pending_signal_prev": pending_signal_prev,
-        "action_taken": "",
-        "approved": "",
-        "reject_reason": "",
-        "orderId": "",
-        "status": "",
-        "executedQty": "",
-        "cummulativeQuoteQty": "",
-        "avgFillPx": "",
-        "position_btc": "",
-        "position_usdt": "",
-        "pnl_proxy": "",
-        "paper_btc": "",
-        "paper_usdt": "",
-        "paper_equity_usdt": "",
-        "paper_pnl_usdt": "",
-        "paper_trade_notional_usdt": "",
-        "paper_fee_usdt": "",
-        "error": "",
-    }
+        return int(match.group(1)), None
+    return None, None
+
+
+_CALIBRATION_DISABLED = ("DISABLED", "", "", "")
+
+# One blank cell per CSV column; copied per poll instead of rebuilding the literal.
+_ROW_TEMPLATE = dict.fromkeys(CSV_FIELDS, "")
+
+
+def _base_row(ts_ns: int, pending_signal_prev: str) -> dict:
+    # ts_ns stays an int; the CSV writer thread renders it as ISO-8601.
+    row = _ROW_TEMPLATE.copy()
+    row["timestamp"] = ts_ns
+    row["pending_signal_prev"] = pending_signal_prev
+    return row
 
 
 def _print_settings(settings: RuntimeSettings) -> None:
@@ -91,6 +77,8 @@ def _print_settings(settings: RuntimeSettings) -> None:
         f" max_errors={settings.max_consecutive_errors}"
         f" resync_every={settings.resync_every_n_polls}"
         f" max_polls={settings.max_polls}"
+        f" poll_interval_decrease={settings.poll_interval_decrease_seconds}"
+        f" keepalive_ping={settings.keepalive_ping_seconds}"
         f" confirmation_m={settings.confirmation_m}"
         f" confirmation_k={settings.confirmation_k}"
         f" threshold_calibration={settings.enable_threshold_calibration}"
@@ -100,8 +88,22 @@ def _print_settings(settings: RuntimeSettings) -> None:
     )
 
 
+# %-templates for the per-poll console lines; formatted in one C-level pass.
+_HEARTBEAT_FORMAT = (
+    "[POLL %d] mid=%.2f imb=%.6f signal_t=%s pending=%s decision=%s approved=%s"
+    " reason=%s acct_btc=%.8f acct_usdt=%.2f paper_btc=%.8f paper_usdt=%.2f\n"
+)
+_TRADE_EVENT_LIVE_FORMAT = (
+    "TRADE: LIVE %s qty=%.8f quote=%.8f avg_fill_px=%.8f status=%s orderId=%s\n"
+)
+_TRADE_EVENT_DRY_RUN_FORMAT = (
+    "TRADE: DRY_RUN(simulated) %s qty=%.8f quote=%.8f avg_fill_px=%.8f"
+    " fee_usdt=%.8f slippage_bps=%.4f status=%s orderId=%s"
+    " (simulated; real account balances should not change)\n"
+)
+
+
 def _print_heartbeat(
-    settings: RuntimeSettings,
     poll_number: int,
     mid: float,
     imbalance: float,
@@ -115,22 +117,22 @@ def _print_heartbeat(
     paper_btc: float,
     paper_usdt: float,
 ) -> None:
-    if (poll_number % settings.print_every_n_polls) != 0:
-        return
-    reason_text = reason or "-"
-    print(
-        f"[POLL {poll_number}]"
-        f" mid={mid:.2f}"
-        f" imb={imbalance:.6f}"
-        f" signal_t={signal_t}"
-        f" pending={pending_prev}"
-        f" decision={decision_side}"
-        f" approved={approved}"
-        f" reason={reason_text}"
-        f" acct_btc={position_btc:.8f}"
-        f" acct_usdt={position_usdt:.2f}"
-        f" paper_btc={paper_btc:.8f}"
-        f" paper_usdt={paper_usdt:.2f}"
+    sys.stdout.write(
+        _HEARTBEAT_FORMAT
+        % (
+            poll_number,
+            mid,
+            imbalance,
+            signal_t,
+            pending_prev,
+            decision_side,
+            approved,
+            reason or "-",
+            position_btc,
+            position_usdt,
+            paper_btc,
+            paper_usdt,
+        )
     )
 
 
@@ -145,35 +147,116 @@ def _print_trade_event(
     fee_usdt: float = 0.0,
     slippage_bps: float = 0.0,
 ) -> None:
-    mode = "DRY_RUN(simulated)" if simulated else "LIVE"
-    note = " (simulated; real account balances should not change)" if simulated else ""
-    cost_text = (
-        f" fee_usdt={fee_usdt:.8f} slippage_bps={slippage_bps:.4f}"
-        if simulated
-        else ""
-    )
-    print(
-        f"TRADE: {mode} {side}"
-        f" qty={qty_btc:.8f}"
-        f" quote={quote_usdt:.8f}"
-        f" avg_fill_px={avg_fill_px:.8f}"
-        f"{cost_text}"
-        f" status={status or '-'}"
-        f" orderId={order_id or '-'}"
-        f"{note}"
+    if simulated:
+        sys.stdout.write(
+            _TRADE_EVENT_DRY_RUN_FORMAT
+            % (
+                side,
+                qty_btc,
+                quote_usdt,
+                avg_fill_px,
+                fee_usdt,
+                slippage_bps,
+                status or "-",
+                order_id or "-",
+            )
+        )
+    else:
+        sys.stdout.write(
+            _TRADE_EVENT_LIVE_FORMAT
+            % (side, qty_btc, quote_usdt, avg_fill_px, status or "-", order_id or "-")
+        )
+
+
+def _apply_fill_to_balances(
+    position_btc: float,
+    position_usdt: float,
+    side: str,
+    result: OrderResult,
+    filters: SymbolFilters,
+) -> tuple[float, float]:
+    # Executed amounts from the order response, net of commission charged in either
+    # leg; commission in a third asset (e.g. BNB) leaves both balances untouched.
+    sign = 1.0 if side == BUY else -1.0
+    commissions = result.commissions
+    position_btc += sign * result.executed_qty - commissions.get(filters.base_asset, 0.0)
+    position_usdt -= sign * result.cummulative_quote_qty + commissions.get(
+        filters.quote_asset, 0.0
     )
+    return position_btc, position_usdt
 
 
-def _confirmed_signal(raw_signal: str, signal_history: deque[str], settings: RuntimeSettings) -> str:
-    signal_history.append(raw_signal)
+def _confirmed_signal(
+    raw_signal: str, signal_history: ConfirmationCounter, settings: RuntimeSettings
+) -> str:
+    signal_history.push(raw_signal)
     if raw_signal not in (BUY, SELL):
         return HOLD
-    confirmation_hits = sum(1 for signal in signal_history if signal == raw_signal)
-    if confirmation_hits >= settings.confirmation_k:
+    if signal_history.hits(raw_signal) >= settings.confirmation_k:
         return raw_signal
     return HOLD
 
 
+# Set by SIGINT/SIGTERM. Plain flags rather than a threading.Event: the handler
+# runs on the main thread, and taking the Event's lock there can deadlock against
+# a wait() that already holds it.
+_stop_requested = False
+_shutting_down = False
+# Loop sleeps run in slices this long, so a stop lands within one slice.
+_STOP_POLL_SECONDS = 0.1
+
+
+def _request_stop(signum: int, frame: Any) -> None:
+    global _stop_requested
+    if _stop_requested and not _shutting_down:
+        # Second signal: stop now instead of after the in-flight poll. Never raised
+        # once shutdown cleanup (cancel-all, CSV close) is under way.
+        raise KeyboardInterrupt
+    _stop_requested = True
+
+
+def _reset_stop_flags() -> None:
+    global _stop_requested, _shutting_down
+    _stop_requested = False
+    _shutting_down = False
+
+
+def _begin_shutdown() -> None:
+    global _shutting_down
+    _shutting_down = True
+
+
+def _interruptible_sleep(seconds: float) -> None:
+    deadline = time.monotonic() + max(seconds, 0.0)
+    while not _stop_requested:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        time.sleep(min(remaining, _STOP_POLL_SECONDS))
+    raise KeyboardInterrupt
+
+
+def _sleep_until_next_tick(next_tick: float, interval: float) -> float:
+    # Absolute schedule: time spent inside a poll does not push later polls back.
+    next_tick += interval
+    delay = next_tick - time.monotonic()
+    if delay > 0:
+        _interruptible_sleep(delay)
+        return next_tick
+    _interruptible_sleep(0.0)
+    return time.monotonic()
+
+
+def _rate_limit_sleep_seconds(
+    backoff_seconds: float, backoff_cap: float, retry_after: Optional[float]
+) -> float:
+    sleep_for = min(backoff_seconds, backoff_cap)
+    if retry_after is not None:
+        # The server's Retry-After is a floor; sleeping less only extends a 418 ban.
+        sleep_for = max(sleep_for, retry_after)
+    return sleep_for
+
+
 def _snapshot_signature(bid: float, ask: float, bid_qty: float, ask_qty: float) -> tuple[float, float, float, float]:
     return (
         round(float(bid), 8),
@@ -232,6 +315,7 @@ def main() -> None:
     paper_equity_end, paper_pnl_end = paper_ledger.mark_to_market(initial_snapshot.mid)
 
     _print_settings(settings)
+    client.start_keepalive(settings.keepalive_ping_seconds)
 
     polls = 0
     orders_placed = 0
@@ -239,9 +323,11 @@ def main() -> None:
     error_count = 0
     consecutive_errors = 0
     pending_signal = HOLD
-    signal_history: deque[str] = deque(maxlen=settings.confirmation_m)
+    signal_history = ConfirmationCounter(maxlen=settings.confirmation_m)
     last_trade_ts: Optional[float] = None
     backoff_seconds = settings.backoff_base_seconds
+    # AIMD cadence: doubles on 418/429, then steps back toward poll_interval.
+    current_interval = settings.poll_interval_seconds
     pnl_proxy_end = 0.0
     min_pnl_proxy = float("inf")
     max_pnl_proxy = float("-inf")
@@ -254,83 +340,122 @@ def main() -> None:
         else settings.stale_snapshot_max_repeats
     )
 
+    # Loop-invariant settings bound to locals for the hot loop.
+    symbol = settings.symbol
+    poll_interval = settings.poll_interval_seconds
+    poll_interval_decrease = settings.poll_interval_decrease_seconds
+    print_every = settings.print_every_n_polls
+    resync_every = settings.resync_every_n_polls
+    max_polls = settings.max_polls
+    max_errors = settings.max_consecutive_errors
+    backoff_base = settings.backoff_base_seconds
+    backoff_cap = settings.backoff_cap_seconds
+    base_asset = filters.base_asset
+    quote_asset = filters.quote_asset
+
+    _reset_stop_flags()
+    # A signal the parent process set to be ignored stays ignored.
+    previous_handlers = {
+        signum: signal.signal(signum, _request_stop)
+        for signum in (signal.SIGINT, signal.SIGTERM)
+        if signal.getsignal(signum) is not signal.SIG_IGN
+    }
+    # Resync polls read balances on this worker while the snapshot is fetched. The
+    # worker has its own client: a requests.Session is not safe to share across
+    # threads.
+    resync_client = BinanceClient(base_url=BASE_URL, api_key=API_KEY, api_secret=API_SECRET)
+    resync_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="balance-resync")
+    next_tick = time.monotonic()
     try:
         while True:
-            if settings.max_polls > 0 and polls >= settings.max_polls:
+            if max_polls > 0 and polls >= max_polls:
                 break
 
-            now = datetime.now(timezone.utc)
-            row = _base_row(ts=now.isoformat(), pending_signal_prev=pending_signal)
+            now_ns = time.time_ns()
+            # Cooldown arithmetic runs on the monotonic clock; wall time is only the
+            # CSV timestamp, so a clock step cannot shorten or stretch a cooldown.
+            now_ts = time.monotonic()
+            row = _base_row(ts_ns=now_ns, pending_signal_prev=pending_signal)
             pending_prev = pending_signal
             polls += 1
             poll_had_error = False
             status_for_backoff: Optional[int] = None
+            retry_after: Optional[float] = None
             paper_trade_notional_usdt = 0.0
             paper_fee_usdt = 0.0
-            dry_run_trade_executed = False
 
+            poll_error_reason = ""
+            balance_future: Optional[Future] = None
+            if polls == 1 or (polls % resync_every) == 0:
+                balance_future = resync_pool.submit(
+                    get_account_balances,
+                    client=resync_client,
+                    base_asset=base_asset,
+                    quote_asset=quote_asset,
+                )
             try:
                 snapshot = get_market_snapshot(
                     client=client,
-                    symbol=settings.symbol,
+                    symbol=symbol,
                     settings=settings,
                 )
-                if polls == 1 or (polls % settings.resync_every_n_polls) == 0:
-                    position_btc, position_usdt = get_account_balances(
-                        client=client,
-                        base_asset=filters.base_asset,
-                        quote_asset=filters.quote_asset,
-                    )
             except Exception as exc:
+                poll_error_reason, msg = "snapshot_exception", str(exc)
+                status_for_backoff, retry_after = _extract_http_status(exc, msg)
+            if balance_future is not None:
+                # Always joined, so a resync never overlaps the next poll.
+                try:
+                    balances = balance_future.result()
+                except Exception as exc:
+                    if not poll_error_reason:
+                        poll_error_reason, msg = "balance_exception", str(exc)
+                        status_for_backoff, retry_after = _extract_http_status(exc, msg)
+                else:
+                    # Kept even if the snapshot failed; the signed call already spent its weight.
+                    position_btc, position_usdt = balances
+            if poll_error_reason:
                 poll_had_error = True
                 error_count += 1
                 consecutive_errors += 1
-                msg = str(exc)
                 row["error"] = msg
                 row["action_taken"] = "POLL_ERROR"
                 row["approved"] = False
-                row["reject_reason"] = "poll_exception"
-                status_for_backoff = _extract_http_status(msg)
+                row["reject_reason"] = poll_error_reason
                 trade_logger.append(row)
-                if (polls % settings.print_every_n_polls) == 0:
-                    print(f"[POLL {polls}] ERROR reason=poll_exception msg={msg}")
-                if consecutive_errors > settings.max_consecutive_errors:
+                trade_logger.flush()
+                if (polls % print_every) == 0:
+                    print(f"[POLL {polls}] ERROR reason={poll_error_reason} msg={msg}")
+                if consecutive_errors > max_errors:
                     print("Stopping: max consecutive errors exceeded.")
                     break
                 if status_for_backoff in {418, 429}:
-                    sleep_for = min(backoff_seconds, settings.backoff_cap_seconds)
+                    sleep_for = _rate_limit_sleep_seconds(backoff_seconds, backoff_cap, retry_after)
                     print(f"Rate limit hit ({status_for_backoff}), sleeping {sleep_for:.1f}s")
-                    time.sleep(sleep_for)
-                    backoff_seconds = min(backoff_seconds * 2, settings.backoff_cap_seconds)
+                    _interruptible_sleep(sleep_for)
+                    next_tick = time.monotonic()
+                    backoff_seconds = min(backoff_seconds * 2, backoff_cap)
+                    current_interval = max(poll_interval, min(current_interval * 2, backoff_cap))
                 else:
-                    time.sleep(settings.poll_interval_seconds)
+                    next_tick = _sleep_until_next_tick(next_tick, current_interval)
                 continue
 
             spread = snapshot.ask - snapshot.bid
-            row.update(
-                {
-                    "timestamp": snapshot.timestamp,
-                    "best_bid": snapshot.bid,
-                    "best_ask": snapshot.ask,
-                    "bid": snapshot.bid,
-                    "ask": snapshot.ask,
-                    "mid": snapshot.mid,
-                    "spread": spread,
-                    "bid_qty": snapshot.bid_qty,
-                    "ask_qty": snapshot.ask_qty,
-                    "imbalance": snapshot.imbalance,
-                    "sizing_enabled": settings.enable_position_sizing,
-                    "sizing_mode": settings.position_sizing_mode,
-                    "notional_target_usdt": 0.0,
-                    "notional_min_usdt": settings.min_notional_per_trade_usdt,
-                    "depth_update_id": (
-                        snapshot.depth_update_id
-                        if snapshot.depth_update_id is not None
-                        else ""
-                    ),
-                    "pending_signal_prev": pending_prev,
-                }
-            )
+            row["timestamp"] = snapshot.timestamp
+            row["best_bid"] = snapshot.bid
+            row["best_ask"] = snapshot.ask
+            row["bid"] = snapshot.bid
+            row["ask"] = snapshot.ask
+            row["mid"] = snapshot.mid
+            row["spread"] = spread
+            row["bid_qty"] = snapshot.bid_qty
+            row["ask_qty"] = snapshot.ask_qty
+            row["imbalance"] = snapshot.imbalance
+            row["sizing_enabled"] = settings.enable_position_sizing
+            row["sizing_mode"] = settings.position_sizing_mode
+            row["notional_target_usdt"] = 0.0
+            row["notional_min_usdt"] = settings.min_notional_per_trade_usdt
+            if snapshot.depth_update_id is not None:
+                row["depth_update_id"] = snapshot.depth_update_id
 
             signature = _snapshot_signature(
                 bid=snapshot.bid,
@@ -352,18 +477,17 @@ def main() -> None:
 
             if settings.stale_snapshot_skip and stale_repeats >= stale_repeat_threshold:
                 stale_msg = f"stale snapshot repeats={stale_repeats}"
-                row.update(
-                    {
-                        "action_taken": "SKIP_POLL",
-                        "approved": False,
-                        "reject_reason": "stale_snapshot",
-                        "error": stale_msg,
-                    }
-                )
+                row["action_taken"] = "SKIP_POLL"
+                row["approved"] = False
+                row["reject_reason"] = "stale_snapshot"
+                row["error"] = stale_msg
                 trade_logger.append(row)
-                if (polls % settings.print_every_n_polls) == 0:
+                if (polls % print_every) == 0:
                     print(f"[POLL {polls}] WARNING reason={stale_msg}")
-                time.sleep(settings.poll_interval_seconds)
+                # A skipped poll still made its request, so it paces and recovers
+                # like any other non-error poll.
+                current_interval = max(poll_interval, current_interval - poll_interval_decrease)
+                next_tick = _sleep_until_next_tick(next_tick, current_interval)
                 continue
 
             previous_snapshot_signature = signature
@@ -373,49 +497,38 @@ def main() -> None:
                 warning_msg = (
                     f"invalid_top_of_book bid={snapshot.bid:.8f} ask={snapshot.ask:.8f}"
                 )
-                row.update(
-                    {
-                        "action_taken": "SKIP_POLL",
-                        "approved": False,
-                        "reject_reason": "invalid_top_of_book",
-                        "error": warning_msg,
-                    }
-                )
+                row["action_taken"] = "SKIP_POLL"
+                row["approved"] = False
+                row["reject_reason"] = "invalid_top_of_book"
+                row["error"] = warning_msg
                 trade_logger.append(row)
-                if (polls % settings.print_every_n_polls) == 0:
+                if (polls % print_every) == 0:
                     print(f"[POLL {polls}] WARNING reason={warning_msg}")
-                time.sleep(settings.poll_interval_seconds)
+                # A skipped poll still made its request, so it paces and recovers
+                # like any other non-error poll.
+                current_interval = max(poll_interval, current_interval - poll_interval_decrease)
+                next_tick = _sleep_until_next_tick(next_tick, current_interval)
                 continue
 
             threshold_used = settings.threshold
-            calib_state = "DISABLED"
-            theta_hat = ""
-            calib_score = ""
-            calib_n = ""
             if calibrator is not None:
                 calibrator.update(snapshot)
                 threshold_used = calibrator.current_threshold(settings.threshold)
-                calib_state = calibrator.state
-                theta_hat = calibrator.last_report.get("theta_hat", "")
-                calib_score = calibrator.last_report.get("score_adj", "")
-                calib_n = calibrator.last_report.get("n", "")
+                calib_state, theta_hat, calib_score, calib_n = calibrator.snapshot_tuple()
+            else:
+                calib_state, theta_hat, calib_score, calib_n = _CALIBRATION_DISABLED
             raw_signal_t = signal_from_imbalance(snapshot.imbalance, threshold_used)
             signal_t = _confirmed_signal(
                 raw_signal=raw_signal_t,
                 signal_history=signal_history,
                 settings=settings,
             )
-            row.update(
-                {
-                    "threshold_used": threshold_used,
-                    "calib_state": calib_state,
-                    "theta_hat": theta_hat,
-                    "calib_score": calib_score,
-                    "calib_n": calib_n,
-                    "signal_t": signal_t,
-                    "pending_signal_prev": pending_prev,
-                }
-            )
+            row["threshold_used"] = threshold_used
+            row["calib_state"] = calib_state
+            row["theta_hat"] = theta_hat
+            row["calib_score"] = calib_score
+            row["calib_n"] = calib_n
+            row["signal_t"] = signal_t
 
             decision = evaluate_pending_signal(
                 pending_signal=pending_prev,
@@ -425,7 +538,7 @@ def main() -> None:
                 position_btc=position_btc,
                 position_usdt=position_usdt,
                 filters=filters,
-                now_ts=now.timestamp(),
+                now_ts=now_ts,
                 last_trade_ts=last_trade_ts,
                 cfg=risk_cfg,
             )
@@ -435,7 +548,7 @@ def main() -> None:
             try:
                 result = execute_trade_decision(
                     client=client,
-                    symbol=settings.symbol,
+                    symbol=symbol,
                     decision=decision,
                     settings=settings,
                 )
@@ -444,37 +557,37 @@ def main() -> None:
                 error_count += 1
                 consecutive_errors += 1
                 msg = str(exc)
-                status_for_backoff = _extract_http_status(msg)
-                result_action = f"ERROR_{decision.side}"
-                row.update(
-                    {
-                        "action_taken": result_action,
-                        "approved": False,
-                        "reject_reason": "execution_exception",
-                        "error": msg,
-                    }
-                )
+                status_for_backoff, retry_after = _extract_http_status(exc, msg)
+                result_action = ERROR_ACTION[decision.side]
+                row["action_taken"] = result_action
+                row["approved"] = False
+                row["reject_reason"] = "execution_exception"
+                row["error"] = msg
             else:
-                row.update(
-                    {
-                        "action_taken": result.action_taken,
-                        "approved": result.approved,
-                        "reject_reason": result.reject_reason,
-                        "orderId": result.order_id,
-                        "status": result.status,
-                        "executedQty": result.executed_qty,
-                        "cummulativeQuoteQty": result.cummulative_quote_qty,
-                        "avgFillPx": result.avg_fill_px,
-                        "error": result.error,
-                    }
-                )
+                row["action_taken"] = result.action_taken
+                row["approved"] = result.approved
+                row["reject_reason"] = result.reject_reason
+                row["orderId"] = result.order_id
+                row["status"] = result.status
+                row["executedQty"] = result.executed_qty
+                row["cummulativeQuoteQty"] = result.cummulative_quote_qty
+                row["avgFillPx"] = result.avg_fill_px
+                row["error"] = result.error
                 if result.placed:
                     orders_placed += 1
+                    # Track the fill locally; the resync_every_n_polls read stays the
+                    # ground truth for drift.
+                    position_btc, position_usdt = _apply_fill_to_balances(
+                        position_btc=position_btc,
+                        position_usdt=position_usdt,
+                        side=decision.side,
+                        result=result,
+                        filters=filters,
+                    )
                 if result.filled:
                     orders_filled += 1
-                if decision.approved and (
-                    result.placed or result.action_taken.startswith("DRY_RUN_")
-                ):
+                is_dry_run_action = result.action_taken.startswith("DRY_RUN_")
+                if decision.approved and (result.placed or is_dry_run_action):
                     paper_trade = apply_dry_run_trade(
                         ledger=paper_ledger,
                         action_taken=result.action_taken,
@@ -488,12 +601,12 @@ def main() -> None:
                     paper_trade_notional_usdt = paper_trade.trade_notional_usdt
                     paper_fee_usdt = paper_trade.fee_usdt
 
-                    if result.action_taken.startswith("DRY_RUN_"):
+                    if is_dry_run_action:
                         trade_qty_btc = paper_trade.executed_qty_btc
                         trade_quote_usdt = paper_trade.trade_notional_usdt
                         trade_avg_fill = paper_trade.exec_px if paper_trade.exec_px > 0 else snapshot.mid
                         trade_status = "DRY_RUN_FILLED" if paper_trade.traded else "DRY_RUN_NO_FILL"
-                        dry_run_trade_executed = (
+                        trade_executed = (
                             paper_trade.traded and (paper_trade.executed_qty_btc > 0.0)
                         )
                     else:
@@ -505,10 +618,13 @@ def main() -> None:
                         )
                         trade_avg_fill = result.avg_fill_px
                         trade_status = result.status
+                        trade_executed = result.executed_qty > 0.0
+                    if trade_executed:
+                        last_trade_ts = now_ts
 
                     if trade_qty_btc > 0.0:
                         _print_trade_event(
-                            simulated=result.action_taken.startswith("DRY_RUN_"),
+                            simulated=is_dry_run_action,
                             side=decision.side,
                             qty_btc=trade_qty_btc,
                             quote_usdt=trade_quote_usdt,
@@ -519,30 +635,18 @@ def main() -> None:
                             slippage_bps=paper_ledger.slippage_bps,
                         )
                     else:
-                        row.update(
-                            {
-                                "action_taken": f"SKIP_{decision.side}",
-                                "approved": False,
-                                "reject_reason": "qty_is_zero",
-                            }
-                        )
-                        if result.action_taken.startswith("DRY_RUN_"):
+                        row["action_taken"] = SKIP_ACTION[decision.side]
+                        row["approved"] = False
+                        row["reject_reason"] = "qty_is_zero"
+                        if is_dry_run_action:
                             row["status"] = "DRY_RUN_NO_FILL"
-                        if (polls % settings.print_every_n_polls) == 0:
+                        if (polls % print_every) == 0:
                             print(
                                 f"[POLL {polls}] SKIP_TRADE"
                                 f" side={decision.side}"
                                 f" reason=qty_is_zero"
                                 f" status={trade_status or '-'}"
                             )
-                if decision.approved and (
-                    (result.placed and result.executed_qty > 0.0)
-                    or (
-                        result.action_taken.startswith("DRY_RUN_")
-                        and dry_run_trade_executed
-                    )
-                ):
-                    last_trade_ts = now.timestamp()
                 if result.error:
                     poll_had_error = True
                     error_count += 1
@@ -550,24 +654,6 @@ def main() -> None:
 
             pending_signal = signal_t
 
-            if (not settings.dry_run) and row.get("orderId"):
-                try:
-                    position_btc, position_usdt = get_account_balances(
-                        client=client,
-                        base_asset=filters.base_asset,
-                        quote_asset=filters.quote_asset,
-                    )
-                except Exception as exc:
-                    poll_had_error = True
-                    error_count += 1
-                    consecutive_errors += 1
-                    msg = str(exc)
-                    if row["error"]:
-                        row["error"] = f"{row['error']} | {msg}"
-                    else:
-                        row["error"] = msg
-                    status_for_backoff = status_for_backoff or _extract_http_status(msg)
-
             pnl_proxy = (position_btc * snapshot.mid + position_usdt) - initial_equity_usdt
             row["position_btc"] = position_btc
             row["position_usdt"] = position_usdt
@@ -582,44 +668,55 @@ def main() -> None:
             pnl_proxy_end = pnl_proxy
             paper_equity_end = paper_equity_usdt
             paper_pnl_end = paper_pnl_usdt
-            min_pnl_proxy = min(min_pnl_proxy, pnl_proxy)
-            max_pnl_proxy = max(max_pnl_proxy, pnl_proxy)
+            if pnl_proxy < min_pnl_proxy:
+                min_pnl_proxy = pnl_proxy
+            if pnl_proxy > max_pnl_proxy:
+                max_pnl_proxy = pnl_proxy
             trade_logger.append(row)
-            _print_heartbeat(
-                settings=settings,
-                poll_number=polls,
-                mid=snapshot.mid,
-                imbalance=snapshot.imbalance,
-                signal_t=signal_t,
-                pending_prev=pending_prev,
-                decision_side=decision.side,
-                approved=decision.approved,
-                reason=decision.reject_reason,
-                position_btc=position_btc,
-                position_usdt=position_usdt,
-                paper_btc=paper_ledger.paper_btc,
-                paper_usdt=paper_ledger.paper_usdt,
-            )
+            if poll_had_error:
+                trade_logger.flush()
+            # Gated here so muted polls skip the call and its argument loads.
+            if (polls % print_every) == 0:
+                _print_heartbeat(
+                    poll_number=polls,
+                    mid=snapshot.mid,
+                    imbalance=snapshot.imbalance,
+                    signal_t=signal_t,
+                    pending_prev=pending_prev,
+                    decision_side=decision.side,
+                    approved=decision.approved,
+                    reason=decision.reject_reason,
+                    position_btc=position_btc,
+                    position_usdt=position_usdt,
+                    paper_btc=paper_ledger.paper_btc,
+                    paper_usdt=paper_ledger.paper_usdt,
+                )
 
             if not poll_had_error:
                 consecutive_errors = 0
-                backoff_seconds = settings.backoff_base_seconds
+                backoff_seconds = backoff_base
+                current_interval = max(poll_interval, current_interval - poll_interval_decrease)
 
-            if consecutive_errors > settings.max_consecutive_errors:
+            if consecutive_errors > max_errors:
                 print("Stopping: max consecutive errors exceeded.")
                 break
 
             if status_for_backoff in {418, 429}:
-                sleep_for = min(backoff_seconds, settings.backoff_cap_seconds)
+                sleep_for = _rate_limit_sleep_seconds(backoff_seconds, backoff_cap, retry_after)
                 print(f"Rate limit hit ({status_for_backoff}), sleeping {sleep_for:.1f}s")
-                time.sleep(sleep_for)
-                backoff_seconds = min(backoff_seconds * 2, settings.backoff_cap_seconds)
+                _interruptible_sleep(sleep_for)
+                next_tick = time.monotonic()
+                backoff_seconds = min(backoff_seconds * 2, backoff_cap)
+                current_interval = max(poll_interval, min(current_interval * 2, backoff_cap))
             else:
-                time.sleep(settings.poll_interval_seconds)
+                next_tick = _sleep_until_next_tick(next_tick, current_interval)
 
     except KeyboardInterrupt:
-        print("KeyboardInterrupt received; shutting down.")
+        print("Stop requested (SIGINT/SIGTERM); shutting down.")
     finally:
+        _begin_shutdown()
+        resync_pool.shutdown(wait=True, cancel_futures=True)
+        resync_client.close()
         canceled = 0
         if settings.dry_run:
             print("DRY_RUN=True, skipping cancel-all-open-orders on shutdown.")
@@ -654,6 +751,13 @@ def main() -> None:
         print(f"paper_trades={paper_trade_count}")
         print(f"paper_win_rate_pct={paper_win_rate}")
         print(f"paper_max_drawdown_usdt={paper_ledger.max_drawdown_usdt}")
+        try:
+            trade_logger.close()
+        except Exception as exc:
+            print(f"Trade log close failed; rows may be missing: {exc}")
+        client.close()
+        for signum, handler in previous_handlers.items():
+            signal.signal(signum, handler)
 
 
 if __name__ == "__main__":
@@ -2,10 +2,20 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+_TRUTHY = frozenset({"1", "true", "yes", "y", "on"})
 
 
 def _parse_bool(value: str) -> bool:
-    return value.strip().lower() in {"1", "true", "yes", "y", "on"}
+    return value.strip().lower() in _TRUTHY
+
+
+@lru_cache(maxsize=1)
+def dry_run_enabled() -> bool:
+    # For the standalone scripts; run_live reads DRY_RUN via load_runtime_settings.
+    return _parse_bool(os.getenv("DRY_RUN", "true"))
 
 
 def _parse_float(value: str, default: float) -> float:
@@ -22,12 +32,13 @@ def _parse_int(value: str, default: int) -> int:
         return default
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RuntimeSettings:
     dry_run: bool
     symbol: str
     threshold: float
     poll_interval_seconds: float
+    poll_interval_decrease_seconds: float
     cooldown_seconds: float
     max_notional_per_trade_usdt: float
     min_notional_per_trade_usdt: float
@@ -45,6 +56,7 @@ class RuntimeSettings:
     print_every_n_polls: int
     backoff_base_seconds: float
     backoff_cap_seconds: float
+    keepalive_ping_seconds: float
     paper_start_usdt: float
     paper_start_btc: float
     paper_fee_rate: float
@@ -64,106 +76,76 @@ class RuntimeSettings:
     calibration_horizon_polls: int
 
 
+# (field, env var, default, lower bound or None). Values below the bound are raised
+# to it; unparsable values fall back to the default.
+_FLOAT_SETTINGS = (
+    ("threshold", "THRESHOLD", 0.06, None),
+    ("poll_interval_seconds", "POLL_INTERVAL_SECONDS", 2.0, 0.1),
+    ("poll_interval_decrease_seconds", "POLL_INTERVAL_DECREASE_SECONDS", 0.25, 0.01),
+    ("cooldown_seconds", "COOLDOWN_SECONDS", 15.0, 0.0),
+    ("max_notional_per_trade_usdt", "MAX_NOTIONAL_PER_TRADE_USDT", 10.0, 0.0),
+    ("min_notional_per_trade_usdt", "MIN_NOTIONAL_PER_TRADE_USDT", 0.0, 0.0),
+    ("max_abs_position_btc", "MAX_ABS_POSITION_BTC", 0.001, 0.0),
+    ("backoff_base_seconds", "BACKOFF_BASE_SECONDS", 2.0, 0.1),
+    ("backoff_cap_seconds", "BACKOFF_CAP_SECONDS", 60.0, 1.0),
+    ("keepalive_ping_seconds", "KEEPALIVE_PING_SECONDS", 0.0, 0.0),
+    ("paper_start_usdt", "PAPER_START_USDT", 10000.0, 0.0),
+    ("paper_start_btc", "PAPER_START_BTC", 0.0, 0.0),
+    ("paper_fee_rate", "PAPER_FEE_RATE", 0.0, 0.0),
+    ("paper_slippage_bps", "PAPER_SLIPPAGE_BPS", 0.0, 0.0),
+    ("thresh_grid_min", "THRESH_GRID_MIN", 0.01, 0.0),
+    ("thresh_grid_max", "THRESH_GRID_MAX", 0.20, None),
+    ("thresh_grid_step", "THRESH_GRID_STEP", 0.01, 0.0001),
+    ("calibration_turnover_penalty_alpha", "CALIBRATION_TURNOVER_PENALTY_ALPHA", 0.0, 0.0),
+    ("calibration_ema_lambda", "CALIBRATION_EMA_LAMBDA", 0.0, 0.0),
+)
+_INT_SETTINGS = (
+    ("depth_levels", "DEPTH_LEVELS", 10, 1),
+    ("stale_snapshot_max_repeats", "STALE_SNAPSHOT_MAX_REPEATS", 2, 0),
+    ("max_consecutive_errors", "MAX_CONSECUTIVE_ERRORS", 5, 1),
+    ("resync_every_n_polls", "RESYNC_EVERY_N_POLLS", 30, 1),
+    ("max_polls", "MAX_POLLS", 0, 0),
+    ("print_every_n_polls", "PRINT_EVERY_N_POLLS", 1, 1),
+    ("confirmation_m", "CONFIRMATION_M", 1, 1),
+    ("confirmation_k", "CONFIRMATION_K", 1, 1),
+    ("calibration_w_polls", "CALIBRATION_W_POLLS", 300, 1),
+    ("calibration_h_polls", "CALIBRATION_H_POLLS", 500, 1),
+    ("calibration_min_trades", "CALIBRATION_MIN_TRADES", 20, 1),
+    ("calibration_horizon_polls", "CALIBRATION_HORIZON_POLLS", 1, 1),
+)
+# (field, env var, default string)
+_BOOL_SETTINGS = (
+    ("dry_run", "DRY_RUN", "true"),
+    ("enable_position_sizing", "ENABLE_POSITION_SIZING", "false"),
+    ("use_depth", "USE_DEPTH", "false"),
+    ("debug_depth_sums", "DEBUG_DEPTH_SUMS", "false"),
+    ("stale_snapshot_skip", "STALE_SNAPSHOT_SKIP", "true"),
+    ("enable_threshold_calibration", "ENABLE_THRESHOLD_CALIBRATION", "false"),
+)
+# (field, env var, allowed values); the first is the default and the fallback.
+_CHOICE_SETTINGS = (
+    ("position_sizing_mode", "POSITION_SIZING_MODE", ("linear_excess", "linear_abs")),
+    ("calibration_mode", "CALIBRATION_MODE", ("warmup_then_trade", "rolling_walk_forward")),
+)
+
+
 def load_runtime_settings() -> RuntimeSettings:
-    confirmation_m = max(1, _parse_int(os.getenv("CONFIRMATION_M", "1"), 1))
-    confirmation_k = max(1, _parse_int(os.getenv("CONFIRMATION_K", "1"), 1))
-    if confirmation_k > confirmation_m:
-        confirmation_k = confirmation_m
-
-    calibration_mode = os.getenv("CALIBRATION_MODE", "warmup_then_trade").strip().lower()
-    if calibration_mode not in {"warmup_then_trade", "rolling_walk_forward"}:
-        calibration_mode = "warmup_then_trade"
-
-    thresh_grid_min = max(0.0, _parse_float(os.getenv("THRESH_GRID_MIN", "0.01"), 0.01))
-    thresh_grid_max = max(
-        thresh_grid_min,
-        _parse_float(os.getenv("THRESH_GRID_MAX", "0.20"), 0.20),
-    )
-    thresh_grid_step = max(
-        0.0001, _parse_float(os.getenv("THRESH_GRID_STEP", "0.01"), 0.01)
-    )
-    stale_snapshot_max_repeats = max(
-        0, _parse_int(os.getenv("STALE_SNAPSHOT_MAX_REPEATS", "2"), 2)
-    )
-    position_sizing_mode = os.getenv("POSITION_SIZING_MODE", "linear_excess").strip().lower()
-    if position_sizing_mode not in {"linear_excess", "linear_abs"}:
-        position_sizing_mode = "linear_excess"
-
-    return RuntimeSettings(
-        dry_run=_parse_bool(os.getenv("DRY_RUN", "true")),
-        symbol=os.getenv("SYMBOL", "BTCUSDT"),
-        threshold=_parse_float(os.getenv("THRESHOLD", "0.06"), 0.06),
-        poll_interval_seconds=max(
-            0.1, _parse_float(os.getenv("POLL_INTERVAL_SECONDS", "2"), 2.0)
-        ),
-        cooldown_seconds=max(0.0, _parse_float(os.getenv("COOLDOWN_SECONDS", "15"), 15.0)),
-        max_notional_per_trade_usdt=max(
-            0.0, _parse_float(os.getenv("MAX_NOTIONAL_PER_TRADE_USDT", "10"), 10.0)
-        ),
-        min_notional_per_trade_usdt=max(
-            0.0, _parse_float(os.getenv("MIN_NOTIONAL_PER_TRADE_USDT", "0"), 0.0)
-        ),
-        max_abs_position_btc=max(
-            0.0, _parse_float(os.getenv("MAX_ABS_POSITION_BTC", "0.001"), 0.001)
-        ),
-        enable_position_sizing=_parse_bool(
-            os.getenv("ENABLE_POSITION_SIZING", "false")
-        ),
-        position_sizing_mode=position_sizing_mode,
-        use_depth=_parse_bool(os.getenv("USE_DEPTH", "false")),
-        depth_levels=max(1, _parse_int(os.getenv("DEPTH_LEVELS", "10"), 10)),
-        debug_depth_sums=_parse_bool(os.getenv("DEBUG_DEPTH_SUMS", "false")),
-        stale_snapshot_max_repeats=stale_snapshot_max_repeats,
-        stale_snapshot_skip=_parse_bool(os.getenv("STALE_SNAPSHOT_SKIP", "true")),
-        max_consecutive_errors=max(
-            1, _parse_int(os.getenv("MAX_CONSECUTIVE_ERRORS", "5"), 5)
-        ),
-        resync_every_n_polls=max(
-            1, _parse_int(os.getenv("RESYNC_EVERY_N_POLLS", "30"), 30)
-        ),
-        max_polls=max(0, _parse_int(os.getenv("MAX_POLLS", "0"), 0)),
-        print_every_n_polls=max(
-            1, _parse_int(os.getenv("PRINT_EVERY_N_POLLS", "1"), 1)
-        ),
-        backoff_base_seconds=max(
-            0.1, _parse_float(os.getenv("BACKOFF_BASE_SECONDS", "2"), 2.0)
-        ),
-        backoff_cap_seconds=max(
-            1.0, _parse_float(os.getenv("BACKOFF_CAP_SECONDS", "60"), 60.0)
-        ),
-        paper_start_usdt=max(0.0, _parse_float(os.getenv("PAPER_START_USDT", "10000"), 10000.0)),
-        paper_start_btc=max(0.0, _parse_float(os.getenv("PAPER_START_BTC", "0"), 0.0)),
-        paper_fee_rate=max(0.0, _parse_float(os.getenv("PAPER_FEE_RATE", "0.0"), 0.0)),
-        paper_slippage_bps=max(
-            0.0, _parse_float(os.getenv("PAPER_SLIPPAGE_BPS", "0.0"), 0.0)
-        ),
-        confirmation_m=confirmation_m,
-        confirmation_k=confirmation_k,
-        enable_threshold_calibration=_parse_bool(
-            os.getenv("ENABLE_THRESHOLD_CALIBRATION", "false")
-        ),
-        calibration_mode=calibration_mode,
-        calibration_w_polls=max(
-            1, _parse_int(os.getenv("CALIBRATION_W_POLLS", "300"), 300)
-        ),
-        calibration_h_polls=max(
-            1, _parse_int(os.getenv("CALIBRATION_H_POLLS", "500"), 500)
-        ),
-        thresh_grid_min=thresh_grid_min,
-        thresh_grid_max=thresh_grid_max,
-        thresh_grid_step=thresh_grid_step,
-        calibration_min_trades=max(
-            1, _parse_int(os.getenv("CALIBRATION_MIN_TRADES", "20"), 20)
-        ),
-        calibration_turnover_penalty_alpha=max(
-            0.0,
-            _parse_float(os.getenv("CALIBRATION_TURNOVER_PENALTY_ALPHA", "0.0"), 0.0),
-        ),
-        calibration_ema_lambda=min(
-            1.0,
-            max(0.0, _parse_float(os.getenv("CALIBRATION_EMA_LAMBDA", "0.0"), 0.0)),
-        ),
-        calibration_horizon_polls=max(
-            1, _parse_int(os.getenv("CALIBRATION_HORIZON_POLLS", "1"), 1)
-        ),
-    )
+    env = os.environ
+    values: dict[str, Any] = {"symbol": env.get("SYMBOL", "BTCUSDT")}
+    for parse, specs in ((_parse_float, _FLOAT_SETTINGS), (_parse_int, _INT_SETTINGS)):
+        for field, var, default, lower in specs:
+            raw = env.get(var)
+            value = default if raw is None else parse(raw, default)
+            values[field] = value if lower is None else max(lower, value)
+    for field, var, default in _BOOL_SETTINGS:
+        values[field] = _parse_bool(env.get(var, default))
+    for field, var, choices in _CHOICE_SETTINGS:
+        choice = env.get(var, choices[0]).strip().lower()
+        values[field] = choice if choice in choices else choices[0]
+
+    # Bounds that depend on another setting.
+    values["thresh_grid_max"] = max(values["thresh_grid_min"], values["thresh_grid_max"])
+    values["calibration_ema_lambda"] = min(1.0, values["calibration_ema_lambda"])
+    if values["confirmation_k"] > values["confirmation_m"]:
+        values["confirmation_k"] = values["confirmation_m"]
+    return RuntimeSettings(**values)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections import deque
+
 BUY = "BUY"
 SELL = "SELL"
 HOLD = "HOLD"
@@ -11,3 +13,20 @@ def signal_from_imbalance(imbalance: float, threshold: float) -> str:
     if imbalance < -threshold:
         return SELL
     return HOLD
+
+
+class ConfirmationCounter:
+    # Last `maxlen` signals with running per-signal counts, so hits() is O(1).
+    def __init__(self, maxlen: int) -> None:
+        self.maxlen = maxlen
+        self._history: deque[str] = deque()
+        self._counts = {BUY: 0, SELL: 0, HOLD: 0}
+
+    def push(self, signal: str) -> None:
+        if len(self._history) == self.maxlen:
+            self._counts[self._history.popleft()] -= 1
+        self._history.append(signal)
+        self._counts[signal] += 1
+
+    def hits(self, signal: str) -> int:
+        return self._counts.get(signal, 0)